@@ -2,7 +2,15 @@ import streamlit as st
 import os
 import tempfile
 import time
-from streamlit_file_reader import file_reader_component, file_reader_with_path_selector
+from streamlit_file_reader import (
+    DEFAULT_RULES,
+    file_reader_component,
+    file_reader_with_path_selector,
+    get_state_manager,
+    log_set_component,
+    log_view_component,
+    multi_file_dashboard,
+)
 
 # Page configuration
 st.set_page_config(
@@ -20,6 +28,8 @@ demo_mode = st.sidebar.selectbox(
         "Basic File Reader",
         "File Reader with Path Selector", 
         "Log File Monitor Demo",
+        "Multi-File Dashboard",
+        "Rotated Log Set",
         "Create Test Files"
     ]
 )
@@ -47,6 +57,7 @@ if demo_mode == "Basic File Reader":
         
         with col2:
             show_line_numbers = st.checkbox("Show line numbers", value=True)
+            highlight = st.checkbox("Highlight log levels", value=False)
         
         with col3:
             auto_refresh = st.checkbox("Auto-refresh", value=False)
@@ -63,7 +74,8 @@ if demo_mode == "Basic File Reader":
             max_lines=max_lines,
             auto_refresh=auto_refresh,
             refresh_interval=refresh_interval,
-            show_line_numbers=show_line_numbers
+            show_line_numbers=show_line_numbers,
+            highlight_rules=DEFAULT_RULES if highlight else None
         )
         
         if content:
@@ -147,20 +159,101 @@ elif demo_mode == "Log File Monitor Demo":
         with open(log_file_path, 'a') as f:
             f.write(log_entry)
     
+    delta_view = st.checkbox(
+        "📡 Delta-push view",
+        value=False,
+        help="Send only appended lines to the browser, which keeps its own scrolling buffer"
+    )
+    
     st.divider()
     
     # Monitor the log file
-    content = file_reader_component(
-        file_path=log_file_path,
-        max_lines=20,
-        auto_refresh=True,
-        refresh_interval=2.0,
-        show_line_numbers=True
-    )
+    if delta_view:
+        content = log_view_component(
+            file_path=log_file_path,
+            max_lines=1000,
+            auto_refresh=True,
+            refresh_interval=2.0
+        )
+    else:
+        content = file_reader_component(
+            file_path=log_file_path,
+            max_lines=20,
+            auto_refresh=True,
+            refresh_interval=2.0,
+            show_line_numbers=True,
+            highlight_rules=DEFAULT_RULES
+        )
     
     # Cleanup info
     st.sidebar.warning("🧹 The demo log file will be automatically cleaned up when you restart the app.")
 
+elif demo_mode == "Multi-File Dashboard":
+    st.header("Multi-File Dashboard")
+    st.write("This demo monitors several files with one batched stat pass and a single refresh cycle.")
+    
+    paths_text = st.text_area(
+        "File paths (one per line):",
+        value="/etc/hosts\n/etc/passwd\n/etc/hostname\n/etc/os-release",
+        height=120
+    )
+    file_paths = [line.strip() for line in paths_text.splitlines() if line.strip()]
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        max_lines = st.number_input("Max lines per file", min_value=5, max_value=200, value=15)
+    
+    with col2:
+        columns = st.slider("Columns", 1, 4, 2)
+    
+    with col3:
+        auto_refresh = st.checkbox("Auto-refresh", value=False)
+        if auto_refresh:
+            refresh_interval = st.slider("Refresh interval (s)", 1.0, 10.0, 2.0)
+        else:
+            refresh_interval = 2.0
+    
+    st.divider()
+    
+    if file_paths:
+        multi_file_dashboard(
+            file_paths=file_paths,
+            max_lines=max_lines,
+            columns=columns,
+            auto_refresh=auto_refresh,
+            refresh_interval=refresh_interval
+        )
+    else:
+        st.warning("Please enter at least one file path")
+
+elif demo_mode == "Rotated Log Set":
+    st.header("Rotated Log Set")
+    st.write("This demo follows a log across rotations, treating `app.log`, `app.log.1`, `app.log.2.gz`... as one stream.")
+    
+    base_path = st.text_input(
+        "Live log file:",
+        value="/var/log/syslog",
+        help="Rotated siblings such as .1 and .2.gz are picked up automatically"
+    )
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        max_lines = st.number_input("Max lines", min_value=10, max_value=500, value=50)
+    
+    with col2:
+        auto_refresh = st.checkbox("Auto-refresh", value=False)
+    
+    st.divider()
+    
+    if base_path:
+        log_set_component(
+            base_path=base_path,
+            max_lines=max_lines,
+            auto_refresh=auto_refresh
+        )
+
 elif demo_mode == "Create Test Files":
     st.header("Create Test Files")
     st.write("Create sample files to test the file reader component.")
@@ -293,4 +386,10 @@ Try the different demo modes to explore all features of the file reader componen
 with st.sidebar.expander("ℹ️ Development Info"):
     st.write("**Component Location:** `streamlit_file_reader/`")
     st.write("**Demo App:** `demo_app.py`")
+    usage = get_state_manager().usage()
+    st.write(
+        f"**Reader Cache:** {usage['total_bytes'] / 1024:,.0f} KB of "
+        f"{usage['budget_bytes'] / 1024 / 1024:,.0f} MB "
+        f"({usage['entries']} entries, {usage['evictions']} evicted)"
+    )
     st.write("**Requirements:** `streamlit >= 1.28.0`")
\ No newline at end of file
@@ -3,19 +3,29 @@ import subprocess
 import threading
 import tempfile
 import os
+import re
 import time
 from pathlib import Path
 from typing import Optional
-from streamlit_file_reader import file_reader_component
+from streamlit_file_reader import (
+    ResourceSampler,
+    WatchRule,
+    alert_watch_component,
+    file_reader_component,
+    file_statistics_panel,
+    high_rate_stream_component,
+)
 
 class ProcessManager:
     """Manages subprocess execution with file output redirection"""
     
-    def __init__(self):
+    def __init__(self, sample_interval: float = 1.0):
         self.process: Optional[subprocess.Popen] = None
         self.output_file: Optional[str] = None
         self.is_running = False
         self.start_time: Optional[float] = None
+        self.sample_interval = sample_interval
+        self.sampler: Optional[ResourceSampler] = None
         
     def start_process(self, command: str, shell: bool = True) -> tuple[bool, str]:
         """Start a subprocess with output redirected to file"""
@@ -46,6 +56,10 @@ class ProcessManager:
             self.is_running = True
             self.start_time = time.time()
             
+            # Sample CPU/RSS/IO of the process tree from /proc
+            self.sampler = ResourceSampler(self.process.pid, interval=self.sample_interval)
+            self.sampler.start()
+            
             # Start monitoring thread
             monitor_thread = threading.Thread(
                 target=self._monitor_process,
@@ -74,6 +88,8 @@ class ProcessManager:
                 self.process.kill()
                 self.process.wait()
             
+            if self.sampler:
+                self.sampler.stop()
             self.is_running = False
             return True, "Process stopped successfully"
             
@@ -110,17 +126,27 @@ class ProcessManager:
                 "status": "Not Started",
                 "pid": None,
                 "runtime": 0,
-                "return_code": None
+                "return_code": None,
+                "cpu_percent": None,
+                "rss_bytes": None
             }
         
         runtime = time.time() - self.start_time if self.start_time else 0
         
-        return {
+        status = {
             "status": "Running" if self.is_running else "Stopped",
             "pid": self.process.pid,
             "runtime": runtime,
-            "return_code": self.process.returncode
+            "return_code": self.process.returncode,
+            "cpu_percent": None,
+            "rss_bytes": None
         }
+        
+        if self.sampler and len(self.sampler.cpu_percent):
+            status["cpu_percent"] = self.sampler.cpu_percent.last()
+            status["rss_bytes"] = self.sampler.rss_bytes.last()
+        
+        return status
 
 # Page configuration
 st.set_page_config(
@@ -154,7 +180,8 @@ with st.sidebar:
             "System Monitoring",
             "File Operations",
             "Network Ping",
-            "Log Generator"
+            "Log Generator",
+            "High-rate Flood"
         ]
     )
     
@@ -165,6 +192,7 @@ with st.sidebar:
         "File Operations": "for file in /etc/*; do echo \"Processing: $file - Size: $(du -h \"$file\" 2>/dev/null | cut -f1)\"; sleep 1; done | head -20",
         "Network Ping": "ping -c 20 google.com",
         "Log Generator": "for i in {1..50}; do echo \"[$(date '+%Y-%m-%d %H:%M:%S')] INFO: Application event #$i - Processing data batch\"; sleep 1; done",
+        "High-rate Flood": "for batch in $(seq 1 600); do seq 1 5000 | sed 's/^/INFO: heartbeat ok, batch item /'; echo 'WARN: queue depth high'; sleep 0.05; done",
         "Custom Command": ""
     }
     
@@ -175,6 +203,15 @@ with st.sidebar:
         help="Enter the shell command or script to execute"
     )
     
+    st.session_state.process_manager.sample_interval = st.slider(
+        "Resource sampling interval (s)",
+        min_value=0.25,
+        max_value=5.0,
+        value=1.0,
+        step=0.25,
+        help="How often CPU, memory and I/O of the process tree are sampled from /proc"
+    )
+    
     # Process control buttons
     col1, col2 = st.columns(2)
     
@@ -212,6 +249,9 @@ with st.sidebar:
     if status["pid"]:
         st.metric("PID", status["pid"])
     st.metric("Runtime", f"{status['runtime']:.1f}s")
+    if status["cpu_percent"] is not None:
+        st.metric("CPU", f"{status['cpu_percent']:.1f}%")
+        st.metric("Memory (RSS)", f"{status['rss_bytes'] / (1024 * 1024):,.1f} MB")
     if status["return_code"] is not None:
         st.metric("Return Code", status["return_code"])
 
@@ -220,7 +260,7 @@ if st.session_state.process_manager.output_file:
     st.subheader("📄 Process Output")
     
     # File monitoring controls
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         max_lines = st.number_input("Max lines", min_value=10, max_value=200, value=50)
@@ -231,6 +271,16 @@ if st.session_state.process_manager.output_file:
     with col3:
         show_line_numbers = st.checkbox("Show line numbers", value=True)
     
+    with col4:
+        high_rate = st.checkbox(
+            "⚡ High-rate mode",
+            value=script_type == "High-rate Flood",
+            help="Throughput meter with a sampled or deduplicated view; cost per refresh stays fixed"
+        )
+    
+    if high_rate:
+        view = st.radio("View", ["sampled", "deduplicated", "tail"], horizontal=True)
+    
     if auto_refresh:
         refresh_interval = st.slider("Refresh interval (s)", 1.0, 10.0, 2.0)
     else:
@@ -240,31 +290,72 @@ if st.session_state.process_manager.output_file:
     output_file_path = st.session_state.process_manager.output_file
     st.info(f"📁 Output file: `{output_file_path}`")
     
-    # Use the file reader component to monitor the output
-    content = file_reader_component(
-        file_path=output_file_path,
-        max_lines=max_lines,
-        auto_refresh=auto_refresh,
-        refresh_interval=refresh_interval,
-        show_line_numbers=show_line_numbers,
-        height=500
-    )
+    # Watch rules run before the reader, whose auto-refresh ends the run
+    with st.expander("🚨 Watch Rules"):
+        patterns = st.text_area(
+            "Patterns to watch for (one regex per line):",
+            value="OutOfMemoryError\ndeadlock\n\\b5\\d\\d\\b\nERROR",
+            height=100
+        )
+        ignore_case = st.checkbox("Ignore case", value=True)
+        try:
+            rules = [
+                WatchRule(pattern, pattern, ignore_case=ignore_case)
+                for pattern in (line.strip() for line in patterns.splitlines())
+                if pattern
+            ]
+        except re.error as e:
+            st.error(f"Invalid pattern: {str(e)}")
+            rules = []
+        if rules:
+            alert_watch_component([output_file_path], rules, max_hits=10)
     
-    # Additional information
-    if content:
-        with st.expander("📈 Output Statistics"):
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric("Lines Read", len(content))
-            
-            with col2:
-                total_chars = sum(len(line) for line in content)
-                st.metric("Total Characters", f"{total_chars:,}")
-            
-            with col3:
-                avg_length = total_chars / len(content) if content else 0
-                st.metric("Avg Line Length", f"{avg_length:.1f}")
+    # Statistics over the whole output file, updated incrementally
+    with st.expander("📈 Output Statistics"):
+        file_statistics_panel(output_file_path)
+    
+    output_col, resources_col = st.columns([3, 1])
+    
+    # Resource charts are drawn first, since the reader's auto-refresh ends the run
+    sampler = st.session_state.process_manager.sampler
+    with resources_col:
+        st.write("**Resources** (process tree)")
+        if sampler is None or not sampler.available:
+            st.info("Resource sampling needs a Linux /proc filesystem")
+        elif len(sampler.cpu_percent) < 2:
+            st.info("Collecting samples...")
+        else:
+            series = sampler.series()
+            st.caption("CPU %")
+            st.line_chart({"CPU %": series["cpu_percent"]}, height=140)
+            st.caption("RSS (MB)")
+            st.line_chart({"RSS MB": series["rss_mb"]}, height=140)
+            st.caption("I/O (KB/s)")
+            st.line_chart({"read": series["read_kb_s"], "write": series["write_kb_s"]}, height=140)
+            st.caption(
+                f"{series['processes'][-1]} processes · "
+                f"sampler overhead {sampler.overhead_percent:.2f}% of a core"
+            )
+    
+    # Use the file reader component to monitor the output
+    with output_col:
+        if high_rate:
+            high_rate_stream_component(
+                file_path=output_file_path,
+                max_lines=max_lines,
+                view=view,
+                auto_refresh=auto_refresh,
+                refresh_interval=refresh_interval
+            )
+        else:
+            file_reader_component(
+                file_path=output_file_path,
+                max_lines=max_lines,
+                auto_refresh=auto_refresh,
+                refresh_interval=refresh_interval,
+                show_line_numbers=show_line_numbers,
+                height=500
+            )
 
 else:
     st.info("👆 Start a process from the sidebar to begin monitoring its output")
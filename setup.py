@@ -13,6 +13,9 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/streamlit-file-reader",
     packages=find_packages(),
+    package_data={
+        "streamlit_file_reader": ["frontend/*"],
+    },
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -30,6 +33,9 @@ setup(
         "streamlit>=1.28.0",
     ],
     extras_require={
+        "stats": [
+            "numpy>=1.21",
+        ],
         "dev": [
             "pytest>=6.0",
             "black>=22.0",
@@ -1,4 +1,33 @@
 from .file_reader import file_reader_component, file_reader_with_path_selector
+from .alerts import AlertMatcher, WatchRule, alert_watch_component
+from .dashboard import multi_file_dashboard
+from .file_stats import FileStatistics, file_statistics_panel
+from .highlighting import DEFAULT_RULES, HighlightRule
+from .index_store import IndexStore
+from .log_set import LogSet, log_set_component
+from .log_view import log_view_component
+from .resource_sampler import ResourceSampler
+from .state_manager import ReaderStateManager, get_state_manager
+from .throughput import high_rate_stream_component
 
 __version__ = "0.1.0"
-__all__ = ["file_reader_component", "file_reader_with_path_selector"]
\ No newline at end of file
+__all__ = [
+    "file_reader_component",
+    "file_reader_with_path_selector",
+    "high_rate_stream_component",
+    "IndexStore",
+    "HighlightRule",
+    "DEFAULT_RULES",
+    "ReaderStateManager",
+    "get_state_manager",
+    "alert_watch_component",
+    "AlertMatcher",
+    "WatchRule",
+    "log_set_component",
+    "LogSet",
+    "ResourceSampler",
+    "file_statistics_panel",
+    "FileStatistics",
+    "log_view_component",
+    "multi_file_dashboard",
+]
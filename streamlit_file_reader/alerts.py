@@ -0,0 +1,332 @@
+import streamlit as st
+import html
+import os
+import re
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from .highlighting import HighlightRule, LineHighlighter
+from .state_manager import get_state_manager
+from .tail import read_head, same_head
+
+
+class WatchRule:
+    """
+    A pattern to watch for in appended log output.
+
+    Parameters:
+    -----------
+    name : str
+        Label shown next to the rule's match counter
+    pattern : str
+        Regular expression, or a literal string when ``literal=True``
+    callback : Callable[[str, str, str, int], None], optional
+        Called as ``callback(rule_name, file_path, line, byte_offset)`` for
+        every matching line
+    literal : bool, default=False
+        Treat ``pattern`` as plain text
+    ignore_case : bool, default=False
+        Match case-insensitively
+    color : str, default="#ff4b4b"
+        Color used when displaying hits
+    """
+
+    def __init__(self, name: str, pattern: str,
+                 callback: Optional[Callable[[str, str, str, int], None]] = None,
+                 literal: bool = False, ignore_case: bool = False,
+                 color: str = "#ff4b4b"):
+        self.name = name
+        self.pattern = re.escape(pattern) if literal else pattern
+        self.callback = callback
+        self.ignore_case = ignore_case
+        self.color = color
+        # Compiled here, exactly as it is matched, so a bad pattern fails
+        # where it's defined
+        self.regex = re.compile(self.pattern, re.MULTILINE | (re.IGNORECASE if ignore_case else 0))
+
+
+class AlertMatcher:
+    """
+    Matches watch rules against bytes appended to a file.
+
+    Appended bytes are decoded as UTF-8 and matched as text. A combined
+    pass over the complete lines (one for case-sensitive rules, one for
+    the rest) finds the lines any rule matches, and each rule is then
+    checked on those lines only. Every rule that matches a line is
+    reported, overlapping rules included. Rules with capture groups (whose
+    backreferences would be renumbered in a combined pattern) get a pass
+    of their own.
+
+    Only complete lines are matched. :meth:`poll` leaves a trailing partial
+    line in the file and reads it again next time; :meth:`feed` carries it
+    over to the next chunk. Either way a match split between two reads is
+    still found.
+
+    Parameters:
+    -----------
+    rules : Sequence[WatchRule]
+        Rules to match
+    max_hits : int, default=200
+        Number of recent hits kept for display
+    max_carry : int, default=1048576
+        Longest partial line waited for; longer lines are matched in pieces
+    """
+
+    def __init__(self, rules: Sequence[WatchRule], max_hits: int = 200,
+                 max_carry: int = 1024 * 1024):
+        self.max_carry = max_carry
+        self.counts: Dict[str, int] = {}
+        self.hits: Deque[Tuple[str, str, int, str]] = deque(maxlen=max_hits)
+        self._offsets: Dict[str, int] = {}
+        self._heads: Dict[str, bytes] = {}
+        self._carry: Dict[str, bytes] = {}
+        self.set_rules(rules)
+
+    def set_rules(self, rules: Sequence[WatchRule]):
+        """Replace the rules, keeping counters and file positions"""
+        self.rules = list(rules)
+        self.counts = {rule.name: self.counts.get(rule.name, 0) for rule in self.rules}
+        self._combined, self._separate_rules = self._compile(self.rules)
+
+    @staticmethod
+    def _compile(rules: Sequence[WatchRule]) -> Tuple[List[Tuple["re.Pattern", List[int]]], List[int]]:
+        # Case-sensitive and insensitive rules get one combined pattern each
+        # (scoped inline flags would defeat the regex engine's literal search)
+        combined = []
+        separate = []
+        for flags in (0, re.IGNORECASE):
+            group = [
+                i for i, rule in enumerate(rules)
+                if bool(rule.ignore_case) == bool(flags) and not rule.regex.groups
+            ]
+            if not group:
+                continue
+            try:
+                regex = re.compile("|".join(f"(?:{rules[i].pattern})" for i in group), flags | re.MULTILINE)
+            except re.error:
+                # e.g. a global inline flag that is only valid at the start
+                separate.extend(group)
+                continue
+            combined.append((regex, group))
+        separate.extend(i for i, rule in enumerate(rules) if rule.regex.groups)
+        return combined, sorted(separate)
+
+    def feed(self, file_path: str, data: bytes, offset: int) -> int:
+        """
+        Match ``data`` read from ``file_path`` at byte ``offset``.
+
+        Returns:
+        --------
+        int
+            Number of matching lines found
+        """
+        carry = self._carry.pop(file_path, b"")
+        buffer = carry + data
+        base = offset - len(carry)
+
+        end = buffer.rfind(b"\n") + 1
+        if not end and len(buffer) > self.max_carry:
+            end = len(buffer)
+        self._carry[file_path] = buffer[end:]
+        return self._match(file_path, buffer[:end], base)
+
+    def _match(self, file_path: str, data: bytes, base: int) -> int:
+        """Match complete lines in ``data``, which starts at byte ``base``"""
+        text = data.decode('utf-8', errors='surrogateescape')
+        found = []
+
+        # Candidate lines from a combined pass, then each rule on those lines
+        for combined, group in self._combined:
+            position = 0
+            while position < len(text):
+                match = combined.search(text, position)
+                if match is None:
+                    break
+                line_start = text.rfind("\n", 0, match.start()) + 1
+                line_end = text.find("\n", match.end())
+                if line_end == -1:
+                    line_end = len(text)
+                for index in group:
+                    if self.rules[index].regex.search(text, line_start, line_end):
+                        found.append((line_start, index, line_end))
+                position = max(line_end + 1, match.end())
+
+        for index in self._separate_rules:
+            regex = self.rules[index].regex
+            position = 0
+            while position < len(text):
+                match = regex.search(text, position)
+                if match is None:
+                    break
+                line_start = text.rfind("\n", 0, match.start()) + 1
+                line_end = text.find("\n", match.end())
+                if line_end == -1:
+                    line_end = len(text)
+                found.append((line_start, index, line_end))
+                # Count each rule once per line: resume at the next line
+                position = max(line_end + 1, match.end())
+
+        # Report hits in file order, and in rule order within a line
+        ascii_only = data.isascii()
+        char_position, byte_position = 0, 0
+        for line_start, index, line_end in sorted(found):
+            if ascii_only:
+                byte_position = line_start
+            else:
+                byte_position += len(text[char_position:line_start].encode('utf-8', errors='surrogateescape'))
+                char_position = line_start
+            line = text[line_start:line_end].rstrip("\r")
+            if not ascii_only:
+                line = line.encode('utf-8', errors='surrogateescape').decode('utf-8', errors='replace')
+
+            rule = self.rules[index]
+            self.counts[rule.name] += 1
+            self.hits.append((rule.name, file_path, base + byte_position, line))
+            if rule.callback is not None:
+                rule.callback(rule.name, file_path, line, base + byte_position)
+        return len(found)
+
+    def poll(self, file_path: str, max_bytes: int = 16 * 1024 * 1024) -> int:
+        """
+        Read and match what was appended to a file since the last poll.
+
+        The first poll starts at the current end of the file. If the file
+        shrinks, or its first bytes change (a copytruncate that has grown
+        past the old position again), it is treated as truncated and
+        matching restarts at 0.
+        """
+        size = os.path.getsize(file_path)
+        head = read_head(file_path)
+        offset = self._offsets.get(file_path)
+        if offset is None:
+            self._offsets[file_path] = size
+            self._heads[file_path] = head
+            return 0
+        if size < offset or not same_head(self._heads[file_path], head):
+            offset = 0
+        self._heads[file_path] = head
+        self._offsets[file_path] = offset
+        if size == offset:
+            return 0
+
+        with open(file_path, 'rb') as file:
+            file.seek(offset)
+            data = file.read(min(size - offset, max_bytes))
+
+        # A trailing partial line stays in the file until its newline arrives
+        end = data.rfind(b"\n") + 1
+        if not end and len(data) > self.max_carry:
+            end = len(data)
+        self._offsets[file_path] = offset + end
+        return self._match(file_path, data[:end], offset)
+
+
+def alert_watch_component(
+    file_paths: List[str],
+    rules: Sequence[WatchRule],
+    max_hits: int = 20,
+    auto_refresh: bool = False,
+    refresh_interval: float = 2.0
+) -> Dict[str, int]:
+    """
+    Watches files for patterns and shows match counters and recent hits.
+
+    Each run matches only the bytes appended since the previous run, starting
+    from the end of each file when the watch is created. Rule callbacks are
+    called once per matching line.
+
+    Parameters:
+    -----------
+    file_paths : List[str]
+        Paths of the files to watch
+    rules : Sequence[WatchRule]
+        Patterns to watch for
+    max_hits : int, default=20
+        Number of recent hits to display
+    auto_refresh : bool, default=False
+        Whether to automatically refresh
+    refresh_interval : float, default=2.0
+        Seconds between auto-refreshes (only when auto_refresh=True)
+
+    Returns:
+    --------
+    Dict[str, int]
+        Match count per rule name since the watch started
+    """
+
+    component_key = f"alert_watch_{hash(tuple(file_paths))}"
+
+    # Counters and file positions can't be rebuilt from the files, so the
+    # matcher stays in the session (it holds only offsets, counters and the
+    # first few KB of each file) where nothing evicts it
+    if f"{component_key}_matcher" not in st.session_state:
+        st.session_state[f"{component_key}_matcher"] = AlertMatcher(rules)
+
+    # Rules are rebuilt on every run; keep counters and file positions
+    matcher = st.session_state[f"{component_key}_matcher"]
+    matcher.set_rules(rules)
+
+    # Recent hits are only for display, so they live in the server-wide
+    # budget and start over if evicted
+    state_manager = get_state_manager()
+    state = state_manager.get(component_key)
+    if state is None:
+        state = {"hits": deque(maxlen=matcher.hits.maxlen)}
+    matcher.hits = state["hits"]
+
+    for file_path in file_paths:
+        try:
+            matcher.poll(file_path)
+        except FileNotFoundError:
+            st.warning(f"File not found: {file_path}")
+        except OSError as e:
+            st.error(f"Error reading {file_path}: {str(e)}")
+
+    state_manager.put(component_key, state)
+
+    # Match counters
+    for col, rule in zip(st.columns(max(1, len(matcher.rules))), matcher.rules):
+        with col:
+            st.metric(rule.name, f"{matcher.counts.get(rule.name, 0):,}")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.caption(f"Watching {len(file_paths)} files · updated {time.strftime('%H:%M:%S')}")
+
+    with col2:
+        if st.button("🗑️ Reset Counters", key=f"{component_key}_reset"):
+            for name in matcher.counts:
+                matcher.counts[name] = 0
+            matcher.hits.clear()
+
+    # Recent hits, with the matched text highlighted
+    hits = list(matcher.hits)[-max_hits:]
+    if hits:
+        highlighter = LineHighlighter(
+            [HighlightRule(rule.pattern, rule.color, ignore_case=rule.ignore_case)
+             for rule in matcher.rules]
+        )
+        rows = [
+            f"<b>{html.escape(rule_name)}</b> · "
+            f"{html.escape(os.path.basename(path))}:{offset} · "
+            f"{highlighter.highlight(offset, line)}"
+            for rule_name, path, offset, line in reversed(hits)
+        ]
+        # One block-level element on a single line, so markdown leaves the
+        # log text alone
+        st.markdown(
+            '<div style="overflow-x:auto;font-family:\'Source Code Pro\',monospace;'
+            f'font-size:0.85rem;white-space:pre;line-height:1.4">{"<br>".join(rows)}</div>',
+            unsafe_allow_html=True
+        )
+    else:
+        st.info("No matches yet")
+
+    if auto_refresh:
+        st.info(f"🔄 Auto-refresh enabled (every {refresh_interval}s)")
+        time.sleep(refresh_interval)
+        st.rerun()
+
+    return dict(matcher.counts)
@@ -0,0 +1,153 @@
+import streamlit as st
+import os
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from .state_manager import get_state_manager
+from .tail import read_tail_lines
+
+
+def _stat_file(file_path: str) -> Tuple[Optional[os.stat_result], Optional[str]]:
+    """Stat a path, returning ``(stat_result, error)``"""
+    try:
+        file_stat = os.stat(file_path)
+    except FileNotFoundError:
+        return None, "File not found"
+    except OSError as e:
+        return None, str(e)
+    if not stat.S_ISREG(file_stat.st_mode):
+        return None, "Not a file"
+    return file_stat, None
+
+
+def _read_file(file_path: str, max_lines: int) -> Tuple[List[str], Optional[str]]:
+    """Read the tail of a file, returning ``(lines, error)``"""
+    try:
+        return [line for _, line in read_tail_lines(file_path, max_lines)], None
+    except OSError as e:
+        return [], str(e)
+
+
+def multi_file_dashboard(
+    file_paths: List[str],
+    max_lines: int = 20,
+    columns: int = 2,
+    auto_refresh: bool = False,
+    refresh_interval: float = 2.0,
+    max_workers: int = 8
+) -> Dict[str, Optional[List[str]]]:
+    """
+    A dashboard that monitors several files in a single refresh cycle.
+
+    All paths are stat'ed in one batched pass on a small thread pool, only
+    the files whose size or mtime changed are re-read, and the whole grid is
+    rendered before a single auto-refresh countdown.
+
+    Parameters:
+    -----------
+    file_paths : List[str]
+        Paths of the files to monitor
+    max_lines : int, default=20
+        Maximum number of lines to display per file (shows last N lines)
+    columns : int, default=2
+        Number of files shown side by side
+    auto_refresh : bool, default=False
+        Whether to automatically refresh the dashboard
+    refresh_interval : float, default=2.0
+        Seconds between auto-refreshes (only when auto_refresh=True)
+    max_workers : int, default=8
+        Threads used to stat and read files, which helps on slow network
+        filesystems
+
+    Returns:
+    --------
+    Dict[str, Optional[List[str]]]
+        Lines read for each path, or None for paths that couldn't be read
+    """
+
+    # Per-file state lives in the shared state manager, which may evict it
+    state_manager = get_state_manager()
+    files = {
+        file_path: state_manager.get(f"file_dashboard_{hash(file_path)}")
+        for file_path in file_paths
+    }
+    workers = max(1, min(max_workers, len(file_paths)))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # One batched stat pass over every path
+        stats = dict(zip(file_paths, executor.map(_stat_file, file_paths)))
+
+        changed = []
+        for file_path, (file_stat, error) in stats.items():
+            entry = files[file_path]
+            if entry is None:
+                entry = files[file_path] = {
+                    "content": [],
+                    "last_modified": 0,
+                    "file_size": 0,
+                    "error": None,
+                    "max_lines": max_lines,
+                }
+                state_manager.put(f"file_dashboard_{hash(file_path)}", entry)
+            if error:
+                entry.update(content=[], last_modified=0, file_size=0, error=error)
+            elif (
+                file_stat.st_mtime != entry["last_modified"]
+                or file_stat.st_size != entry["file_size"]
+                or entry["max_lines"] != max_lines
+                or entry["error"]
+            ):
+                changed.append(file_path)
+
+        # Read only the files that changed since the last cycle
+        reads = executor.map(lambda path: _read_file(path, max_lines), changed)
+        for file_path, (lines, error) in zip(changed, reads):
+            file_stat = stats[file_path][0]
+            files[file_path].update(
+                content=lines,
+                last_modified=file_stat.st_mtime,
+                file_size=file_stat.st_size,
+                error=error,
+                max_lines=max_lines,
+            )
+            state_manager.put(f"file_dashboard_{hash(file_path)}", files[file_path])
+
+    st.caption(
+        f"{len(file_paths)} files checked, {len(changed)} changed · "
+        f"updated {time.strftime('%H:%M:%S')}"
+    )
+
+    results: Dict[str, Optional[List[str]]] = {}
+    for row_start in range(0, len(file_paths), columns):
+        row_paths = file_paths[row_start:row_start + columns]
+        for col, file_path in zip(st.columns(columns), row_paths):
+            entry = files[file_path]
+            with col:
+                st.write(f"**`{os.path.basename(file_path) or file_path}`**")
+                if entry["error"]:
+                    st.error(f"{entry['error']}: {file_path}")
+                    results[file_path] = None
+                    continue
+
+                modified_time = time.strftime('%H:%M:%S', time.localtime(entry["last_modified"]))
+                st.caption(f"{entry['file_size']:,} bytes · modified {modified_time}")
+                if entry["content"]:
+                    st.code("\n".join(entry["content"]), language=None)
+                else:
+                    st.info("No content to display")
+                results[file_path] = entry["content"]
+
+    # A single countdown for the whole dashboard
+    if auto_refresh:
+        st.info(f"🔄 Auto-refresh enabled (every {refresh_interval}s)")
+        countdown_placeholder = st.empty()
+        for i in range(int(refresh_interval), 0, -1):
+            countdown_placeholder.text(f"Next refresh in {i} seconds...")
+            time.sleep(1)
+        time.sleep(refresh_interval - int(refresh_interval))
+        countdown_placeholder.empty()
+        st.rerun()
+
+    return results
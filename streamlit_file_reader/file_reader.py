@@ -4,6 +4,22 @@ from pathlib import Path
 from typing import Optional, List
 import time
 
+from .highlighting import DEFAULT_RULES, HighlightRule, LineHighlighter, render_highlighted_html
+from .index_store import IndexStore
+from .state_manager import get_state_manager
+from .tail import read_tail_lines
+
+
+_index_store: Optional[IndexStore] = None
+
+
+def _get_index_store() -> IndexStore:
+    """Shared persistent index store, created on first use"""
+    global _index_store
+    if _index_store is None:
+        _index_store = IndexStore()
+    return _index_store
+
 
 def file_reader_component(
     file_path: str,
@@ -11,7 +27,9 @@ def file_reader_component(
     auto_refresh: bool = False,
     refresh_interval: float = 2.0,
     show_line_numbers: bool = True,
-    height: int = 400
+    height: int = 400,
+    persistent_index: bool = False,
+    highlight_rules: Optional[List[HighlightRule]] = None
 ) -> Optional[List[str]]:
     """
     A Streamlit component that reads and displays file content.
@@ -30,6 +48,14 @@ def file_reader_component(
         Whether to show line numbers
     height : int, default=400
         Height of the display area in pixels
+    persistent_index : bool, default=False
+        Keep a line index of the file in the on-disk index store so line
+        numbers are exact; the index survives server restarts and only
+        appended bytes are indexed on later reads
+    highlight_rules : List[HighlightRule], optional
+        Rules used to color log levels, timestamps or other patterns (see
+        ``DEFAULT_RULES``). Highlighted lines are memoized by byte offset so
+        a refresh only tokenizes newly appended lines.
     
     Returns:
     --------
@@ -37,14 +63,23 @@ def file_reader_component(
         List of lines read from the file, or None if file doesn't exist
     """
     
-    # Initialize session state for this component instance
+    # Initialize state for this component instance; the state manager may
+    # evict it under memory pressure, in which case the file is read again
     component_key = f"file_reader_{hash(file_path)}"
+    state_manager = get_state_manager()
+    state = state_manager.get(component_key)
     
-    if f"{component_key}_content" not in st.session_state:
-        st.session_state[f"{component_key}_content"] = []
-        st.session_state[f"{component_key}_last_modified"] = 0
-        st.session_state[f"{component_key}_file_size"] = 0
-        st.session_state[f"{component_key}_error"] = None
+    if state is None:
+        state = {
+            "content": [],
+            "last_modified": 0,
+            "file_size": 0,
+            "error": None,
+            "start_line": None,
+            "offsets": [],
+            "highlighter": None,
+        }
+        state_manager.put(component_key, state)
     
     # File path validation and display
     st.write(f"**File:** `{file_path}`")
@@ -55,13 +90,13 @@ def file_reader_component(
         # Check if file exists
         if not file_path_obj.exists():
             st.error(f"File not found: {file_path}")
-            st.session_state[f"{component_key}_error"] = "File not found"
+            state["error"] = "File not found"
             return None
         
         # Check if it's actually a file
         if not file_path_obj.is_file():
             st.error(f"Path is not a file: {file_path}")
-            st.session_state[f"{component_key}_error"] = "Not a file"
+            state["error"] = "Not a file"
             return None
         
         # Get file stats
@@ -71,33 +106,34 @@ def file_reader_component(
         
         # Check if file has been modified
         should_read = (
-            current_modified != st.session_state[f"{component_key}_last_modified"] or
-            current_size != st.session_state[f"{component_key}_file_size"] or
-            not st.session_state[f"{component_key}_content"]
+            current_modified != state["last_modified"] or
+            current_size != state["file_size"] or
+            not state["content"]
         )
         
         if should_read:
             try:
-                # Read file content
-                with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
-                    lines = file.readlines()
-                
-                # Keep only the last max_lines
-                if len(lines) > max_lines:
-                    lines = lines[-max_lines:]
+                # Read only the last max_lines from the end of the file
+                tail = read_tail_lines(file_path, max_lines)
+                lines = [line for _, line in tail]
                 
-                # Strip newlines but preserve empty lines
-                lines = [line.rstrip('\n\r') for line in lines]
+                start_line = None
+                if persistent_index and tail:
+                    file_index = _get_index_store().open(file_path)
+                    start_line = file_index.line_number(tail[0][0]) + 1
                 
-                # Update session state
-                st.session_state[f"{component_key}_content"] = lines
-                st.session_state[f"{component_key}_last_modified"] = current_modified
-                st.session_state[f"{component_key}_file_size"] = current_size
-                st.session_state[f"{component_key}_error"] = None
+                # Update state
+                state["content"] = lines
+                state["start_line"] = start_line
+                state["offsets"] = [offset for offset, _ in tail]
+                state["last_modified"] = current_modified
+                state["file_size"] = current_size
+                state["error"] = None
+                state_manager.put(component_key, state)
                 
             except Exception as e:
                 st.error(f"Error reading file: {str(e)}")
-                st.session_state[f"{component_key}_error"] = str(e)
+                state["error"] = str(e)
                 return None
         
         # Display file info
@@ -111,7 +147,7 @@ def file_reader_component(
             st.metric("Last Modified", modified_time)
         
         with col3:
-            total_lines = len(st.session_state[f"{component_key}_content"])
+            total_lines = len(state["content"])
             st.metric("Lines Displayed", f"{total_lines:,}")
         
         # Control buttons
@@ -120,27 +156,52 @@ def file_reader_component(
         with col1:
             if st.button("🔄 Refresh", key=f"{component_key}_refresh"):
                 # Force refresh by clearing the modified time
-                st.session_state[f"{component_key}_last_modified"] = 0
+                state["last_modified"] = 0
                 st.rerun()
         
         with col2:
             clear_content = st.button("🗑️ Clear Display", key=f"{component_key}_clear")
             if clear_content:
-                st.session_state[f"{component_key}_content"] = []
+                state["content"] = []
+                state["offsets"] = []
+                state_manager.put(component_key, state)
                 st.success("Display cleared")
         
         # Display content
-        content = st.session_state[f"{component_key}_content"]
+        content = state["content"]
         
         if content:
             # Create container with specified height
             with st.container():
                 st.write(f"**Content** (showing last {len(content)} lines):")
                 
+                start_line_num = state["start_line"]
+                if start_line_num is None:
+                    start_line_num = max(1, file_stat.st_size // 80 - len(content) + 1) if file_stat.st_size > 0 else 1
+                
                 # Display lines with or without line numbers
-                if show_line_numbers:
+                if highlight_rules:
+                    highlighter = state["highlighter"]
+                    if highlighter is None or highlighter.signature() != tuple(
+                        rule.signature() for rule in highlight_rules
+                    ):
+                        highlighter = LineHighlighter(highlight_rules, cache_size=max(4 * max_lines, 1000))
+                        state["highlighter"] = highlighter
+                    
+                    offsets = state["offsets"]
+                    st.markdown(
+                        render_highlighted_html(
+                            list(zip(offsets, content)),
+                            highlighter,
+                            start_line=start_line_num if show_line_numbers else None,
+                            height=height
+                        ),
+                        unsafe_allow_html=True
+                    )
+                    # Account for the lines the highlighter just memoized
+                    state_manager.put(component_key, state)
+                elif show_line_numbers:
                     display_text = ""
-                    start_line_num = max(1, file_stat.st_size // 80 - len(content) + 1) if file_stat.st_size > 0 else 1
                     
                     for i, line in enumerate(content):
                         line_num = start_line_num + i
@@ -172,7 +233,7 @@ def file_reader_component(
         
     except Exception as e:
         st.error(f"Unexpected error: {str(e)}")
-        st.session_state[f"{component_key}_error"] = str(e)
+        state["error"] = str(e)
         return None
 
 
@@ -182,7 +243,9 @@ def file_reader_with_path_selector(
     auto_refresh: bool = False,
     refresh_interval: float = 2.0,
     show_line_numbers: bool = True,
-    height: int = 400
+    height: int = 400,
+    persistent_index: bool = False,
+    highlight_rules: Optional[List[HighlightRule]] = None
 ) -> Optional[List[str]]:
     """
     File reader component with built-in path selector.
@@ -229,6 +292,21 @@ def file_reader_with_path_selector(
                 "Show line numbers",
                 value=show_line_numbers
             )
+            
+            persistent_index = st.checkbox(
+                "Exact line numbers",
+                value=persistent_index,
+                help="Keep a persistent line index of the file on disk"
+            )
+            
+            highlight = st.checkbox(
+                "Highlight log levels",
+                value=bool(highlight_rules)
+            )
+            if highlight and not highlight_rules:
+                highlight_rules = DEFAULT_RULES
+            elif not highlight:
+                highlight_rules = None
         
         with col2:
             auto_refresh = st.checkbox(
@@ -253,5 +331,7 @@ def file_reader_with_path_selector(
         auto_refresh=auto_refresh,
         refresh_interval=refresh_interval,
         show_line_numbers=show_line_numbers,
-        height=height
+        height=height,
+        persistent_index=persistent_index,
+        highlight_rules=highlight_rules
     )
\ No newline at end of file
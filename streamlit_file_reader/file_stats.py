@@ -0,0 +1,304 @@
+import streamlit as st
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple
+
+import pandas as pd
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency (the "stats" extra)
+    np = None
+
+
+DEFAULT_LEVELS: Dict[str, Tuple[str, ...]] = {
+    "ERROR": ("ERROR", "FATAL", "CRITICAL"),
+    "WARN": ("WARN", "WARNING"),
+    "INFO": ("INFO",),
+    "DEBUG": ("DEBUG", "TRACE"),
+}
+
+# Line lengths are bucketed by powers of two: 0, 1, 2-3, 4-7, ...
+_HISTOGRAM_BUCKETS = 32
+_PREFIX_BYTES = 4096
+# Files with statistics kept in memory, least recently viewed dropped first
+_STATISTICS_CACHE_SIZE = 16
+
+# "YYYY-MM-DD HH:MM" (or "T" separator), optionally preceded by "["
+_TIMESTAMP_DIGITS = (0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15)
+_TIMESTAMP_WEIGHTS = (
+    10 ** 11, 10 ** 10, 10 ** 9, 10 ** 8,
+    10 ** 7, 10 ** 6, 10 ** 5, 10 ** 4,
+    10 ** 3, 10 ** 2, 10 ** 1, 10 ** 0,
+)
+
+
+def _is_letter(values):
+    upper = values & 0xDF
+    return (upper >= ord("A")) & (upper <= ord("Z"))
+
+
+class FileStatistics:
+    """
+    Whole-file statistics computed with NumPy over a memory map.
+
+    Tracks total lines, a line-length histogram, lines per log level and
+    lines per minute (from a leading ``YYYY-MM-DD HH:MM`` timestamp). Each
+    :meth:`update` processes only complete lines appended since the last
+    one, so the first pass over a large file costs a full scan and later
+    passes cost only the new bytes. The statistics restart if the file is
+    replaced or truncated.
+
+    Parameters:
+    -----------
+    file_path : str
+        Path to the file
+    levels : Dict[str, Sequence[str]], optional
+        Level name to the tokens that mark it (defaults to ``DEFAULT_LEVELS``);
+        tokens match as whole words
+    chunk_size : int, default=16777216
+        Bytes processed per vectorized step
+    max_minutes : int, default=10080
+        Most recent minutes kept in ``lines_per_minute`` (a week)
+    """
+
+    def __init__(self, file_path: str, levels: Optional[Dict[str, Sequence[str]]] = None,
+                 chunk_size: int = 16 * 1024 * 1024, max_minutes: int = 7 * 24 * 60):
+        if np is None:
+            raise ImportError("FileStatistics requires numpy (pip install numpy)")
+        self.file_path = file_path
+        self.levels = {name: tuple(tokens) for name, tokens in (levels or DEFAULT_LEVELS).items()}
+        self.chunk_size = chunk_size
+        self.max_minutes = max_minutes
+        self.lock = threading.Lock()
+        self._reset(None, b"")
+
+    def _reset(self, identity: Optional[Tuple[int, int]], prefix: bytes):
+        self._identity = identity
+        self._prefix = prefix
+        self.processed = 0
+        self.line_count = 0
+        self.total_length = 0
+        self.max_line_length = 0
+        self.length_histogram = np.zeros(_HISTOGRAM_BUCKETS, dtype=np.int64)
+        self.level_counts = {name: 0 for name in self.levels}
+        self.lines_per_minute: Dict[int, int] = {}
+        self.last_update_seconds = 0.0
+
+    def update(self) -> "FileStatistics":
+        """Process the complete lines appended since the last update"""
+        with self.lock:
+            started = time.perf_counter()
+            file_stat = os.stat(self.file_path)
+            size = file_stat.st_size
+            identity = (file_stat.st_dev, file_stat.st_ino)
+
+            with open(self.file_path, 'rb') as file:
+                prefix = file.read(min(size, _PREFIX_BYTES))
+            if (
+                identity != self._identity
+                or size < self.processed
+                or not prefix.startswith(self._prefix[:len(prefix)])
+            ):
+                self._reset(identity, prefix)
+            self._prefix = prefix
+
+            if size > self.processed:
+                data = np.memmap(self.file_path, dtype=np.uint8, mode='r', shape=(size,))
+                try:
+                    self._process(data, size)
+                finally:
+                    del data
+
+            self.last_update_seconds = time.perf_counter() - started
+            return self
+
+    def _process(self, data, size: int):
+        start = self.processed
+        span = self.chunk_size
+        while start < size:
+            end = min(start + span, size)
+            chunk = data[start:end]
+            newlines = np.flatnonzero(chunk == 10)
+            if not newlines.size:
+                if end == size:
+                    break  # Only a partial line is left; wait for its newline
+                span *= 2  # A line longer than the chunk: widen the window
+                continue
+
+            self._process_lines(chunk[:newlines[-1] + 1], newlines)
+            start += int(newlines[-1]) + 1
+            self.processed = start
+            span = self.chunk_size
+
+    def _process_lines(self, chunk, newlines):
+        """Vectorized statistics for ``chunk``, which ends with a newline"""
+        starts = np.concatenate(([0], newlines[:-1] + 1))
+        lengths = newlines - starts
+        # Don't count the "\r" of "\r\n" line endings
+        has_cr = (lengths > 0) & (chunk[np.maximum(newlines - 1, 0)] == 13)
+        lengths = lengths - has_cr
+
+        self.line_count += int(newlines.size)
+        self.total_length += int(lengths.sum())
+        self.max_line_length = max(self.max_line_length, int(lengths.max()))
+        buckets = np.minimum(np.frexp(lengths.astype(np.float64))[1], _HISTOGRAM_BUCKETS - 1)
+        self.length_histogram += np.bincount(buckets, minlength=_HISTOGRAM_BUCKETS)
+
+        # Tokens sharing a first byte share one full pass over the chunk
+        candidates: Dict[int, "np.ndarray"] = {}
+        for name, tokens in self.levels.items():
+            lines = []
+            for token in tokens:
+                token = token.encode()
+                if token[0] not in candidates:
+                    candidates[token[0]] = np.flatnonzero(chunk == token[0])
+                lines.append(self._token_lines(chunk, newlines, token, candidates[token[0]]))
+            self.level_counts[name] += int(np.unique(np.concatenate(lines)).size)
+
+        self._count_minutes(chunk, starts)
+
+    @staticmethod
+    def _token_lines(chunk, newlines, token: bytes, positions):
+        """Indices of the lines containing ``token`` as a whole word"""
+        width = len(token)
+        # Narrow the first-byte positions down one byte at a time
+        positions = positions[positions + width <= chunk.size]
+        for i in range(1, width):
+            positions = positions[chunk[positions + i] == token[i]]
+        if not positions.size:
+            return np.empty(0, dtype=np.int64)
+
+        before = positions - 1
+        after = positions + width
+        whole = ~_is_letter(chunk[np.maximum(before, 0)]) | (before < 0)
+        whole &= ~_is_letter(chunk[np.minimum(after, chunk.size - 1)]) | (after >= chunk.size)
+        return np.searchsorted(newlines, positions[whole])
+
+    def _count_minutes(self, chunk, starts):
+        # Skip an opening "[" and make sure 16 bytes fit before the chunk end
+        offsets = starts + (chunk[np.minimum(starts, chunk.size - 1)] == ord("["))
+        offsets = offsets[offsets + 16 <= chunk.size]
+        if not offsets.size:
+            return
+
+        stamps = chunk[offsets[:, None] + np.arange(16)].astype(np.int64)
+        digits = stamps[:, _TIMESTAMP_DIGITS] - ord("0")
+        valid = np.all((digits >= 0) & (digits <= 9), axis=1)
+        valid &= (stamps[:, 4] == ord("-")) & (stamps[:, 7] == ord("-")) & (stamps[:, 13] == ord(":"))
+        valid &= (stamps[:, 10] == ord(" ")) | (stamps[:, 10] == ord("T"))
+        if not valid.any():
+            return
+
+        keys = digits[valid] @ np.array(_TIMESTAMP_WEIGHTS, dtype=np.int64)
+        minutes, counts = np.unique(keys, return_counts=True)
+        for minute, count in zip(minutes.tolist(), counts.tolist()):
+            self.lines_per_minute[minute] = self.lines_per_minute.get(minute, 0) + count
+
+        if len(self.lines_per_minute) > self.max_minutes:
+            for minute in sorted(self.lines_per_minute)[:-self.max_minutes]:
+                del self.lines_per_minute[minute]
+
+    @staticmethod
+    def histogram_bounds():
+        """Longest line length counted in each histogram bucket"""
+        return [2 ** bucket - 1 for bucket in range(_HISTOGRAM_BUCKETS)]
+
+
+_statistics: "OrderedDict[str, FileStatistics]" = OrderedDict()
+_statistics_lock = threading.Lock()
+
+
+def get_file_statistics(file_path: str) -> FileStatistics:
+    """Up-to-date statistics for a file, shared by all sessions"""
+    key = os.path.realpath(file_path)
+    with _statistics_lock:
+        statistics = _statistics.get(key)
+        if statistics is None:
+            statistics = _statistics[key] = FileStatistics(key)
+        _statistics.move_to_end(key)
+        # Temporary files come and go; keep the most recently viewed ones
+        while len(_statistics) > _STATISTICS_CACHE_SIZE:
+            _statistics.popitem(last=False)
+
+    try:
+        return statistics.update()
+    except FileNotFoundError:
+        with _statistics_lock:
+            if _statistics.get(key) is statistics:
+                del _statistics[key]
+        raise
+
+
+def file_statistics_panel(file_path: str, max_minutes: int = 240) -> Optional[FileStatistics]:
+    """
+    A panel with statistics over the whole file, not just the displayed tail.
+
+    Requires numpy. The first view scans the file once; later views only
+    process appended lines.
+
+    Parameters:
+    -----------
+    file_path : str
+        Path to the file
+    max_minutes : int, default=240
+        Number of most recent minutes shown in the lines-per-minute chart
+
+    Returns:
+    --------
+    Optional[FileStatistics]
+        The statistics, or None if they couldn't be computed
+    """
+
+    if np is None:
+        st.warning("File statistics require numpy: `pip install streamlit-file-reader[stats]`")
+        return None
+
+    try:
+        statistics = get_file_statistics(file_path)
+    except OSError as e:
+        st.error(f"Error reading file: {str(e)}")
+        return None
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Total Lines", f"{statistics.line_count:,}")
+
+    with col2:
+        average = statistics.total_length / statistics.line_count if statistics.line_count else 0
+        st.metric("Avg Line Length", f"{average:.1f}")
+
+    with col3:
+        st.metric("Longest Line", f"{statistics.max_line_length:,}")
+
+    with col4:
+        st.metric("Update Time", f"{statistics.last_update_seconds * 1000:,.1f} ms")
+
+    level_cols = st.columns(max(1, len(statistics.level_counts)))
+    for col, (name, count) in zip(level_cols, statistics.level_counts.items()):
+        with col:
+            st.metric(name, f"{count:,}")
+
+    histogram = statistics.length_histogram
+    used = np.flatnonzero(histogram)
+    if used.size:
+        bounds = statistics.histogram_bounds()[used[0]:used[-1] + 1]
+        st.caption("Line length distribution (lines up to each length)")
+        st.bar_chart(pd.DataFrame(
+            {"lines": histogram[used[0]:used[-1] + 1]},
+            index=pd.Index(bounds, name="max length")
+        ))
+
+    if statistics.lines_per_minute:
+        minutes = sorted(statistics.lines_per_minute)[-max_minutes:]
+        index = pd.to_datetime([str(minute) for minute in minutes], format="%Y%m%d%H%M", errors="coerce")
+        st.caption("Lines per minute")
+        st.line_chart(pd.DataFrame(
+            {"lines": [statistics.lines_per_minute[minute] for minute in minutes]},
+            index=index
+        ))
+
+    return statistics
@@ -0,0 +1,148 @@
+// Log view frontend: keeps a line buffer in the browser and applies
+// sequence-numbered deltas sent by the server, rendering only the rows
+// inside the viewport.
+(function () {
+  "use strict";
+
+  const ROW_HEIGHT = 20;
+  const OVERSCAN = 20;
+  const LEVELS = [
+    [/\b(?:ERROR|FATAL|CRITICAL|SEVERE)\b/, "error"],
+    [/\bWARN(?:ING)?\b/, "warn"],
+    [/\b(?:DEBUG|TRACE)\b/, "debug"],
+  ];
+
+  const viewport = document.getElementById("viewport");
+  const spacer = document.getElementById("spacer");
+  const status = document.getElementById("status");
+
+  // Each entry is [byte_offset, text, line_number_or_null]
+  let lines = [];
+  let epoch = null;
+  let appliedSeq = 0;
+  let maxLines = 1000;
+  let showLineNumbers = true;
+  let frameHeight = 0;
+  let resyncRequested = null;
+
+  function send(type, data) {
+    window.parent.postMessage(
+      Object.assign({ isStreamlitMessage: true, type: type }, data),
+      "*"
+    );
+  }
+
+  function setFrameHeight(height) {
+    if (height !== frameHeight) {
+      frameHeight = height;
+      send("streamlit:setFrameHeight", { height: height });
+    }
+  }
+
+  function levelClass(text) {
+    for (const [pattern, name] of LEVELS) {
+      if (pattern.test(text)) {
+        return name;
+      }
+    }
+    return "";
+  }
+
+  function render() {
+    spacer.style.height = lines.length * ROW_HEIGHT + "px";
+    const first = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN);
+    const last = Math.min(
+      lines.length,
+      Math.ceil((viewport.scrollTop + viewport.clientHeight) / ROW_HEIGHT) + OVERSCAN
+    );
+
+    const fragment = document.createDocumentFragment();
+    for (let i = first; i < last; i++) {
+      const [offset, text, number] = lines[i];
+      const row = document.createElement("div");
+      row.className = "row " + levelClass(text);
+      row.style.top = i * ROW_HEIGHT + "px";
+      if (showLineNumbers) {
+        const gutter = document.createElement("span");
+        gutter.className = "gutter";
+        gutter.textContent = number !== null ? number : "@" + offset;
+        row.appendChild(gutter);
+      }
+      row.appendChild(document.createTextNode(text));
+      fragment.appendChild(row);
+    }
+    spacer.replaceChildren(fragment);
+  }
+
+  function requestResync() {
+    // A fresh id so the server handles each request once
+    resyncRequested = Date.now();
+    send("streamlit:setComponentValue", {
+      value: { applied_seq: appliedSeq, resync: resyncRequested },
+      dataType: "json",
+    });
+  }
+
+  function apply(args) {
+    maxLines = args.max_lines;
+    showLineNumbers = args.show_line_numbers;
+    viewport.style.height = args.height + "px";
+    setFrameHeight(args.height + 24);
+
+    const atBottom =
+      viewport.scrollTop + viewport.clientHeight >= viewport.scrollHeight - ROW_HEIGHT;
+
+    if (args.reset) {
+      if (args.epoch === epoch && args.seq <= appliedSeq && resyncRequested === null) {
+        return; // Already applied; the server re-sent unchanged arguments
+      }
+      lines = [];
+      epoch = args.epoch;
+      resyncRequested = null;
+    } else if (args.epoch === epoch && args.seq === appliedSeq) {
+      return; // Idle run: nothing new
+    } else if (args.epoch !== epoch || args.base_seq !== appliedSeq) {
+      // Missed a delta (e.g. the frame was remounted): ask for a full resync
+      if (resyncRequested === null) {
+        requestResync();
+      }
+      return;
+    }
+
+    let number = args.start_line;
+    if (!args.reset && lines.length && args.start_line === null) {
+      const previous = lines[lines.length - 1][2];
+      number = previous !== null ? previous + 1 : null;
+    }
+    for (const [offset, text] of args.lines) {
+      lines.push([offset, text, number]);
+      if (number !== null) {
+        number += 1;
+      }
+    }
+    if (lines.length > maxLines) {
+      lines.splice(0, lines.length - maxLines);
+    }
+    appliedSeq = args.seq;
+
+    status.textContent =
+      lines.length.toLocaleString() + " lines · update #" + appliedSeq +
+      " · +" + args.lines.length.toLocaleString() + (args.reset ? " (full)" : "");
+
+    render();
+    if (atBottom || args.reset) {
+      viewport.scrollTop = viewport.scrollHeight;
+      render();
+    }
+  }
+
+  viewport.addEventListener("scroll", render, { passive: true });
+
+  window.addEventListener("message", function (event) {
+    if (event.data && event.data.type === "streamlit:render") {
+      apply(event.data.args);
+    }
+  });
+
+  send("streamlit:componentReady", { apiVersion: 1 });
+})();
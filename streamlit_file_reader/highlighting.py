@@ -0,0 +1,139 @@
+import html
+import re
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+
+
+class HighlightRule:
+    """
+    A pattern to highlight in displayed lines.
+
+    Parameters:
+    -----------
+    pattern : str
+        Regular expression to look for
+    color : str
+        CSS color used for the match
+    whole_line : bool, default=False
+        Color the whole line when the pattern matches, instead of only the
+        matched text
+    ignore_case : bool, default=False
+        Match case-insensitively
+    """
+
+    def __init__(self, pattern: str, color: str, whole_line: bool = False,
+                 ignore_case: bool = False):
+        self.pattern = pattern
+        self.color = color
+        self.whole_line = whole_line
+        self.ignore_case = ignore_case
+        self.regex = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
+    def signature(self) -> Tuple[str, str, bool, bool]:
+        return (self.pattern, self.color, self.whole_line, self.ignore_case)
+
+    def __repr__(self) -> str:
+        return f"HighlightRule({self.pattern!r}, {self.color!r}, whole_line={self.whole_line})"
+
+
+DEFAULT_RULES = [
+    HighlightRule(r"\b(?:ERROR|FATAL|CRITICAL|SEVERE)\b", "#ff4b4b", whole_line=True),
+    HighlightRule(r"\bWARN(?:ING)?\b", "#ffa421", whole_line=True),
+    HighlightRule(r"\b(?:DEBUG|TRACE)\b", "#808495", whole_line=True),
+    HighlightRule(r"\bINFO\b", "#21c354"),
+    HighlightRule(r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?", "#1c83e1"),
+]
+
+
+class LineHighlighter:
+    """
+    Turns lines into highlighted HTML, memoized by line byte offset.
+
+    A tail that only grows keeps the same offsets for lines already seen, so
+    each refresh only tokenizes the newly appended lines.
+
+    Parameters:
+    -----------
+    rules : Sequence[HighlightRule]
+        Rules to apply; the first matching whole-line rule colors the line
+    cache_size : int, default=10000
+        Maximum number of highlighted lines kept
+    """
+
+    def __init__(self, rules: Sequence[HighlightRule], cache_size: int = 10000):
+        self.rules = list(rules)
+        self.cache_size = cache_size
+        self._line_rules = [rule for rule in self.rules if rule.whole_line]
+        self._token_rules = [rule for rule in self.rules if not rule.whole_line]
+        self._cache: "OrderedDict[int, Tuple[str, str]]" = OrderedDict()
+
+    def signature(self) -> Tuple:
+        return tuple(rule.signature() for rule in self.rules)
+
+    def _tokenize(self, line: str) -> str:
+        spans = []
+        for rule in self._token_rules:
+            for match in rule.regex.finditer(line):
+                if match.end() > match.start():
+                    spans.append((match.start(), match.end(), rule.color))
+
+        # Earlier rules win where matches overlap
+        parts = []
+        position = 0
+        for start, end, color in sorted(spans, key=lambda span: span[0]):
+            if start < position:
+                continue
+            parts.append(html.escape(line[position:start]))
+            parts.append(f'<span style="color:{color}">{html.escape(line[start:end])}</span>')
+            position = end
+        parts.append(html.escape(line[position:]))
+        text = "".join(parts)
+
+        for rule in self._line_rules:
+            if rule.regex.search(line):
+                return f'<span style="color:{rule.color}">{text}</span>'
+        return text
+
+    def nbytes(self) -> int:
+        """Approximate bytes held by the memoized lines"""
+        return sum(len(line) + len(markup) for line, markup in self._cache.values())
+
+    def highlight(self, offset: int, line: str) -> str:
+        """Highlighted HTML for the line starting at byte ``offset``"""
+        cached = self._cache.get(offset)
+        if cached is not None and cached[0] == line:
+            self._cache.move_to_end(offset)
+            return cached[1]
+
+        markup = self._tokenize(line)
+        self._cache[offset] = (line, markup)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return markup
+
+
+def render_highlighted_html(
+    lines: Sequence[Tuple[int, str]],
+    highlighter: LineHighlighter,
+    start_line: Optional[int] = None,
+    height: int = 400
+) -> str:
+    """
+    Build a scrollable HTML block for ``(byte_offset, line)`` pairs.
+
+    Only the given lines are rendered, so callers pass the visible window.
+    Line numbers are added when ``start_line`` is given.
+    """
+    rows: List[str] = []
+    for i, (offset, line) in enumerate(lines):
+        markup = highlighter.highlight(offset, line)
+        if start_line is not None:
+            markup = f'<span style="opacity:0.5">{start_line + i:4d} | </span>{markup}'
+        rows.append(markup)
+
+    return (
+        f'<div style="height:{height}px;overflow:auto;padding:0.75rem 1rem;'
+        'border-radius:0.5rem;background-color:rgba(151,166,195,0.1);'
+        'font-family:\'Source Code Pro\',monospace;font-size:0.85rem;'
+        f'white-space:pre;line-height:1.4">{"<br>".join(rows)}</div>'
+    )
@@ -0,0 +1,258 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    dev INTEGER NOT NULL,
+    ino INTEGER NOT NULL,
+    prefix_hash TEXT NOT NULL,
+    prefix_len INTEGER NOT NULL,
+    boundary_hash TEXT NOT NULL,
+    indexed_size INTEGER NOT NULL,
+    line_count INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    updated REAL NOT NULL,
+    UNIQUE (dev, ino)
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    file_id INTEGER NOT NULL REFERENCES files (id) ON DELETE CASCADE,
+    line INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    PRIMARY KEY (file_id, line)
+) WITHOUT ROWID;
+"""
+
+
+def default_index_path() -> str:
+    """Location of the shared index database"""
+    return os.environ.get(
+        "STREAMLIT_FILE_READER_INDEX",
+        os.path.join(os.path.expanduser("~"), ".cache", "streamlit_file_reader", "index.sqlite3")
+    )
+
+
+def _hash_range(file, start: int, length: int) -> str:
+    file.seek(start)
+    return hashlib.blake2b(file.read(length), digest_size=16).hexdigest()
+
+
+def _nth_newline(data: bytes, start: int, n: int) -> int:
+    """Index of the ``n``-th newline at or after ``start`` (which must exist)"""
+    count, low, step = 0, start, 4096
+    # Gallop forward, then bisect, so only bytes.count touches most bytes
+    while True:
+        high = min(low + step, len(data))
+        found = data.count(b"\n", low, high)
+        if count + found >= n:
+            break
+        count, low, step = count + found, high, step * 2
+    while high - low > 64:
+        middle = (low + high) // 2
+        found = data.count(b"\n", low, middle)
+        if count + found >= n:
+            high = middle
+        else:
+            count, low = count + found, middle
+    index = low - 1
+    for _ in range(n - count):
+        index = data.find(b"\n", index + 1)
+    return index
+
+
+class FileIndex:
+    """
+    Line index of one file, as loaded from an :class:`IndexStore`.
+
+    Line numbers are 0-based. The start offset of every ``stride``-th line
+    is stored, so locating any line or offset reads at most one stride of
+    the file.
+    """
+
+    def __init__(self, store: "IndexStore", file_id: int, file_path: str,
+                 indexed_size: int, line_count: int):
+        self._store = store
+        self._file_id = file_id
+        self.file_path = file_path
+        self.indexed_size = indexed_size
+        self.line_count = line_count
+
+    def _checkpoint_before(self, column: str, value: int):
+        with self._store._connection() as conn:
+            return conn.execute(
+                f"SELECT line, offset FROM checkpoints WHERE file_id = ? AND {column} <= ? "
+                f"ORDER BY {column} DESC LIMIT 1",
+                (self._file_id, value)
+            ).fetchone() or (0, 0)
+
+    def line_offset(self, line: int) -> Optional[int]:
+        """Byte offset where ``line`` starts, or None if beyond the index"""
+        if line < 0 or line > self.line_count:
+            return None
+        base_line, offset = self._checkpoint_before("line", line)
+        with open(self.file_path, 'rb') as file:
+            file.seek(offset)
+            for _ in range(line - base_line):
+                offset += len(file.readline())
+        return offset
+
+    def line_number(self, offset: int) -> int:
+        """0-based number of the line containing byte ``offset``"""
+        offset = max(0, min(offset, self.indexed_size))
+        base_line, base_offset = self._checkpoint_before("offset", offset)
+        with open(self.file_path, 'rb') as file:
+            file.seek(base_offset)
+            return base_line + file.read(offset - base_offset).count(b"\n")
+
+
+class IndexStore:
+    """
+    Persistent on-disk line index shared by all sessions.
+
+    Files are identified by ``(st_dev, st_ino)`` and a hash of their first
+    bytes. Opening a file validates the stored entry with two small reads
+    (the prefix and the bytes just before the indexed end) and then indexes
+    only the bytes appended since, so an index survives server restarts and
+    a large file is scanned at most once.
+
+    Parameters:
+    -----------
+    db_path : str, optional
+        SQLite database to use (defaults to :func:`default_index_path`)
+    stride : int, default=1000
+        Store the start offset of every ``stride``-th line
+    prefix_bytes : int, default=4096
+        Bytes hashed at the start of the file and before the indexed end
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, db_path: Optional[str] = None, stride: int = 1000,
+                 prefix_bytes: int = 4096, chunk_size: int = 4 * 1024 * 1024):
+        self.db_path = db_path or default_index_path()
+        self.stride = stride
+        self.prefix_bytes = prefix_bytes
+        self.chunk_size = chunk_size
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        conn = self._connection()
+        # WAL is a property of the database file, so setting it once is enough
+        conn.execute("PRAGMA journal_mode = WAL")
+        with conn:
+            conn.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection, opened on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA foreign_keys = ON")
+            self._local.conn = conn
+        return conn
+
+    def open(self, file_path: str) -> FileIndex:
+        """Load the index for a file, validating it and indexing appended bytes"""
+        # Serialise writers in this process; SQLite handles other processes
+        with self._lock, open(file_path, 'rb') as file:
+            file_stat = os.fstat(file.fileno())
+            size = file_stat.st_size
+            prefix_len = min(size, self.prefix_bytes)
+            prefix_hash = _hash_range(file, 0, prefix_len)
+
+            with self._connection() as conn:
+                row = conn.execute(
+                    "SELECT id, prefix_hash, prefix_len, boundary_hash, indexed_size, line_count "
+                    "FROM files WHERE dev = ? AND ino = ?",
+                    (file_stat.st_dev, file_stat.st_ino)
+                ).fetchone()
+
+                if row and not self._is_valid(file, size, *row[1:5]):
+                    conn.execute("DELETE FROM files WHERE id = ?", (row[0],))
+                    row = None
+
+                if row is None:
+                    file_id = conn.execute(
+                        "INSERT INTO files (dev, ino, prefix_hash, prefix_len, boundary_hash, "
+                        "indexed_size, line_count, path, updated) VALUES (?, ?, ?, ?, ?, 0, 0, ?, ?)",
+                        (file_stat.st_dev, file_stat.st_ino, prefix_hash, prefix_len,
+                         _hash_range(file, 0, 0), file_path, time.time())
+                    ).lastrowid
+                    conn.execute(
+                        "INSERT INTO checkpoints (file_id, line, offset) VALUES (?, 0, 0)",
+                        (file_id,)
+                    )
+                    indexed_size, line_count = 0, 0
+                else:
+                    file_id, _, _, _, indexed_size, line_count = row
+
+                if size > indexed_size:
+                    indexed_size, line_count = self._extend(
+                        conn, file, file_id, indexed_size, line_count, size
+                    )
+                    conn.execute(
+                        "UPDATE files SET prefix_hash = ?, prefix_len = ?, boundary_hash = ?, "
+                        "indexed_size = ?, line_count = ?, path = ?, updated = ? WHERE id = ?",
+                        (prefix_hash, prefix_len, self._boundary_hash(file, indexed_size),
+                         indexed_size, line_count, file_path, time.time(), file_id)
+                    )
+
+        return FileIndex(self, file_id, file_path, indexed_size, line_count)
+
+    def _boundary_hash(self, file, indexed_size: int) -> str:
+        length = min(indexed_size, self.prefix_bytes)
+        return _hash_range(file, indexed_size - length, length)
+
+    def _is_valid(self, file, size: int, prefix_hash: str, prefix_len: int,
+                  boundary_hash: str, indexed_size: int) -> bool:
+        """Cheap check that the file still starts with the indexed bytes"""
+        if size < indexed_size or size < prefix_len:
+            return False
+        return (
+            _hash_range(file, 0, prefix_len) == prefix_hash
+            and self._boundary_hash(file, indexed_size) == boundary_hash
+        )
+
+    def _extend(self, conn: sqlite3.Connection, file, file_id: int,
+                indexed_size: int, line_count: int, size: int):
+        """Index ``[indexed_size, size)``, storing every stride-th line start"""
+        file.seek(indexed_size)
+        position = indexed_size
+        checkpoints = []
+        while position < size:
+            chunk = file.read(min(self.chunk_size, size - position))
+            if not chunk:
+                break
+            start = 0
+            # Count newlines in bulk and only locate the checkpoint lines,
+            # so the scan runs at bytes.count speed
+            remaining = chunk.count(b"\n")
+            while True:
+                needed = self.stride - line_count % self.stride
+                if remaining < needed:
+                    line_count += remaining
+                    break
+                newline = _nth_newline(chunk, start, needed)
+                line_count += needed
+                remaining -= needed
+                checkpoints.append((file_id, line_count, position + newline + 1))
+                start = newline + 1
+            position += len(chunk)
+
+        conn.executemany(
+            "INSERT OR REPLACE INTO checkpoints (file_id, line, offset) VALUES (?, ?, ?)",
+            checkpoints
+        )
+        return position, line_count
+
+    def forget(self, file_path: str):
+        """Drop the stored index of a file"""
+        file_stat = os.stat(file_path)
+        with self._lock, self._connection() as conn:
+            conn.execute(
+                "DELETE FROM files WHERE dev = ? AND ino = ?",
+                (file_stat.st_dev, file_stat.st_ino)
+            )
@@ -0,0 +1,441 @@
+import streamlit as st
+import gzip
+import os
+import re
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .tail import read_tail_lines
+
+
+# Archives never change once rotated, so their decompressed length and tail
+# are computed once per process and shared by every LogSet
+_archive_cache: Dict[Tuple[int, int, int, float], Tuple[int, bytes]] = {}
+_archive_lock = threading.Lock()
+_ARCHIVE_CACHE_SIZE = 64
+# Bytes compared at the start of the live file and the end of the newest archive
+_SIGNATURE_BYTES = 4096
+
+
+def _archive_info(path: str, file_stat: os.stat_result, tail_bytes: int) -> Tuple[int, bytes]:
+    """Decompressed length and last ``tail_bytes`` of a gzip archive"""
+    key = (file_stat.st_dev, file_stat.st_ino, file_stat.st_size, file_stat.st_mtime)
+    with _archive_lock:
+        cached = _archive_cache.get(key)
+    if cached is not None and len(cached[1]) >= min(cached[0], tail_bytes):
+        return cached
+
+    length = 0
+    tail = b""
+    with gzip.open(path, 'rb') as file:
+        while True:
+            chunk = file.read(1024 * 1024)
+            if not chunk:
+                break
+            length += len(chunk)
+            tail = (tail + chunk)[-tail_bytes:]
+
+    with _archive_lock:
+        _archive_cache[key] = (length, tail)
+        # Deleted archives leave stale entries behind; keep the newest ones
+        while len(_archive_cache) > _ARCHIVE_CACHE_SIZE:
+            del _archive_cache[next(iter(_archive_cache))]
+    return length, tail
+
+
+class Segment:
+    """One file of a log set and its place in the virtual stream"""
+
+    def __init__(self, path: str, file_stat: os.stat_result, length: int,
+                 compressed: bool, tail: bytes = b""):
+        self.path = path
+        self.ino = file_stat.st_ino
+        self.dev = file_stat.st_dev
+        self.length = length
+        self.compressed = compressed
+        self.tail = tail
+        self.start = 0
+
+    @property
+    def end(self) -> int:
+        return self.start + self.length
+
+    def open(self):
+        return gzip.open(self.path, 'rb') if self.compressed else open(self.path, 'rb')
+
+    def __repr__(self) -> str:
+        return f"Segment({self.path!r}, start={self.start}, length={self.length})"
+
+
+class LogSet:
+    """
+    A rotated log set read as one continuous virtual stream.
+
+    ``app.log``, ``app.log.1``, ``app.log.2.gz``... are ordered oldest to
+    newest and given global byte offsets. Offsets stay stable across
+    rotations: on each :meth:`refresh` the live file is compared with what
+    was seen before, and a rotation (a new inode for rename rotation, or a
+    shrunken file for copytruncate) places the newest archive where the
+    live file used to start. Older archives dropping off the end never
+    shift the offsets of newer data.
+
+    A copytruncate rotation is also recognised when the live file has grown
+    past its previous size before the next refresh: its first bytes no
+    longer match, or the newest archive is one that wasn't there before.
+
+    Gzip archives are decompressed once to learn their length and keep
+    their tail, so tailing across a rotation boundary doesn't re-read them.
+
+    Parameters:
+    -----------
+    base_path : str
+        Path of the live log file (e.g. ``/var/log/app.log``)
+    tail_bytes : int, default=1048576
+        Decompressed bytes kept from the end of each gzip archive
+    """
+
+    def __init__(self, base_path: str, tail_bytes: int = 1024 * 1024):
+        self.base_path = base_path
+        self.tail_bytes = tail_bytes
+        self.segments: List[Segment] = []
+        self.last_rotation: Optional[str] = None
+        self._base_ino: Optional[int] = None
+        self._base_start = 0
+        self._base_length = 0
+        self._base_head = b""
+        self._newest_archive: Optional[Tuple[int, bytes]] = None
+
+    def _discover(self) -> List[Tuple[int, str]]:
+        """Rotated siblings of the base file as ``(generation, path)``"""
+        directory = os.path.dirname(os.path.abspath(self.base_path))
+        name = re.escape(os.path.basename(self.base_path))
+        pattern = re.compile(rf"^{name}\.(\d+)(\.gz)?$")
+        found = []
+        for entry in os.listdir(directory):
+            match = pattern.match(entry)
+            if match:
+                found.append((int(match.group(1)), os.path.join(directory, entry)))
+        return sorted(found)
+
+    def refresh(self) -> List[Segment]:
+        """Re-scan the set, detect rotation and recompute global offsets"""
+        newest_first = []
+        paths = [(0, self.base_path)] + self._discover()
+        for _, path in paths:
+            try:
+                file_stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if path.endswith(".gz"):
+                length, tail = _archive_info(path, file_stat, self.tail_bytes)
+                newest_first.append(Segment(path, file_stat, length, True, tail))
+            else:
+                newest_first.append(Segment(path, file_stat, file_stat.st_size, False))
+
+        if not newest_first or newest_first[0].path != self.base_path:
+            # No live file at the moment (mid-rotation); keep the old view
+            return self.segments
+
+        base = newest_first[0]
+        archives = newest_first[1:]
+        head = self._read_head(base)
+        newest_archive = self._signature(archives[0]) if archives else None
+        if self._base_ino is None:
+            # First scan: the oldest archive starts the stream at offset 0
+            base.start = sum(segment.length for segment in archives)
+        elif (
+            base.ino != self._base_ino
+            or base.length < self._base_length
+            or not head.startswith(self._base_head[:len(head)])
+            or not self._base_head.startswith(head[:len(self._base_head)])
+            or (newest_archive is not None and newest_archive != self._newest_archive)
+        ):
+            # Rename gives a new inode, copytruncate a shrunken file (or, if it
+            # has grown again since, new first bytes and a new newest archive);
+            # either way the newest archive now holds what the live file used to
+            self.last_rotation = "rename" if base.ino != self._base_ino else "copytruncate"
+            if archives:
+                base.start = self._base_start + archives[0].length
+            else:
+                base.start = self._base_start + self._base_length
+        else:
+            base.start = self._base_start
+
+        # Archives are laid out back to back, ending where the live file starts
+        position = base.start
+        for segment in archives:
+            position -= segment.length
+            segment.start = position
+
+        self._base_ino = base.ino
+        self._base_start = base.start
+        self._base_length = base.length
+        self._base_head = head
+        self._newest_archive = newest_archive
+        self.segments = list(reversed(newest_first))
+        return self.segments
+
+    @staticmethod
+    def _read_head(segment: Segment) -> bytes:
+        try:
+            with segment.open() as file:
+                return file.read(min(segment.length, _SIGNATURE_BYTES))
+        except OSError:
+            return b""
+
+    def _signature(self, segment: Segment) -> Tuple[int, bytes]:
+        """Decompressed length and last bytes, which survive compression of an archive"""
+        width = min(_SIGNATURE_BYTES, self.tail_bytes, segment.length)
+        if segment.compressed:
+            return segment.length, segment.tail[len(segment.tail) - width:]
+        try:
+            with segment.open() as file:
+                file.seek(segment.length - width)
+                return segment.length, file.read(width)
+        except OSError:
+            return segment.length, b""
+
+    @property
+    def start(self) -> int:
+        """Global offset of the oldest byte still on disk"""
+        return self.segments[0].start if self.segments else 0
+
+    @property
+    def end(self) -> int:
+        """Global offset just past the newest byte"""
+        return self.segments[-1].end if self.segments else 0
+
+    def tail_lines(self, max_lines: int) -> List[Tuple[int, str, str]]:
+        """
+        The last lines of the stream, crossing rotation boundaries.
+
+        Returns:
+        --------
+        List[Tuple[int, str, str]]
+            ``(global_offset, line, segment_path)``, oldest first
+        """
+        collected: List[Tuple[int, str, str]] = []
+        for segment in reversed(self.segments):
+            needed = max_lines - len(collected)
+            if needed <= 0:
+                break
+            if segment.compressed:
+                lines = self._lines_from_tail(segment, needed)
+                if len(lines) < needed and len(segment.tail) < segment.length:
+                    # The cached tail ran out; older lines would be skipped
+                    lines = self._lines_from_archive(segment, needed)
+            else:
+                lines = read_tail_lines(segment.path, needed, end_offset=segment.length)
+            collected = [
+                (segment.start + offset, line, segment.path) for offset, line in lines
+            ] + collected
+        return collected
+
+    @staticmethod
+    def _lines_from_tail(segment: Segment, max_lines: int) -> List[Tuple[int, str]]:
+        data = segment.tail
+        base = segment.length - len(data)
+        raw_lines = data.split(b"\n")
+        offsets = []
+        offset = base
+        for raw in raw_lines:
+            offsets.append(offset)
+            offset += len(raw) + 1
+        if raw_lines and raw_lines[-1] == b"":
+            raw_lines.pop()
+            offsets.pop()
+        if base > 0 and raw_lines:
+            raw_lines.pop(0)
+            offsets.pop(0)
+        return [
+            (line_offset, raw.rstrip(b"\r").decode('utf-8', errors='replace'))
+            for line_offset, raw in list(zip(offsets, raw_lines))[-max_lines:]
+        ]
+
+    @staticmethod
+    def _lines_from_archive(segment: Segment, max_lines: int) -> List[Tuple[int, str]]:
+        """Last lines of an archive, decompressing all of it"""
+        lines: "deque[Tuple[int, str]]" = deque(maxlen=max_lines)
+        position = 0
+        with segment.open() as file:
+            for raw in file:
+                if position >= segment.length:
+                    break
+                lines.append((position, raw.rstrip(b"\r\n").decode('utf-8', errors='replace')))
+                position += len(raw)
+        return list(lines)
+
+    def iter_lines(self, start: Optional[int] = None) -> Iterator[Tuple[int, str, str]]:
+        """
+        Lines from global offset ``start`` onwards, oldest first.
+
+        If ``start`` falls inside a line, iteration begins at the next one.
+        Seeking into a gzip archive decompresses it up to that point.
+        """
+        start = self.start if start is None else max(start, self.start)
+        for segment in list(self.segments):
+            if segment.end <= start:
+                continue
+            local = max(0, start - segment.start)
+            with segment.open() as file:
+                if local:
+                    file.seek(local - 1)
+                    # Skip to the start of the next line
+                    local += len(file.readline()) - 1
+                position = local
+                while position < segment.length:
+                    raw = file.readline()
+                    if not raw:
+                        break
+                    if position + len(raw) > segment.length:
+                        raw = raw[:segment.length - position]
+                    yield (
+                        segment.start + position,
+                        raw.rstrip(b"\r\n").decode('utf-8', errors='replace'),
+                        segment.path,
+                    )
+                    position += len(raw)
+
+    def page(self, start: int, max_lines: int) -> List[Tuple[int, str, str]]:
+        """``max_lines`` lines from global offset ``start``"""
+        lines = []
+        for item in self.iter_lines(start):
+            lines.append(item)
+            if len(lines) >= max_lines:
+                break
+        return lines
+
+    def search(self, pattern: str, max_hits: int = 100,
+               start: Optional[int] = None, ignore_case: bool = False) -> List[Tuple[int, str, str]]:
+        """Lines matching a regex, searched from ``start`` across all segments"""
+        regex = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+        hits = []
+        for item in self.iter_lines(start):
+            if regex.search(item[1]):
+                hits.append(item)
+                if len(hits) >= max_hits:
+                    break
+        return hits
+
+
+def log_set_component(
+    base_path: str,
+    max_lines: int = 100,
+    auto_refresh: bool = False,
+    refresh_interval: float = 2.0
+) -> Optional[List[str]]:
+    """
+    A file reader that follows a log across rotations.
+
+    Shows the tail of the rotated set as one stream, marking where each
+    file begins, and allows paging and searching by global offset across
+    rotation boundaries.
+
+    Parameters:
+    -----------
+    base_path : str
+        Path of the live log file
+    max_lines : int, default=100
+        Maximum number of lines to display (shows last N lines)
+    auto_refresh : bool, default=False
+        Whether to automatically refresh
+    refresh_interval : float, default=2.0
+        Seconds between auto-refreshes (only when auto_refresh=True)
+
+    Returns:
+    --------
+    Optional[List[str]]
+        Lines displayed, or None if the log set can't be read
+    """
+
+    component_key = f"log_set_{hash(base_path)}"
+
+    if f"{component_key}_log_set" not in st.session_state:
+        st.session_state[f"{component_key}_log_set"] = LogSet(base_path)
+
+    log_set = st.session_state[f"{component_key}_log_set"]
+
+    st.write(f"**Log set:** `{base_path}`")
+
+    try:
+        segments = log_set.refresh()
+    except OSError as e:
+        st.error(f"Error reading log set: {str(e)}")
+        return None
+
+    if not segments:
+        st.error(f"File not found: {base_path}")
+        return None
+
+    # Stream info
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("Files", len(segments))
+
+    with col2:
+        st.metric("Stream Size", f"{log_set.end - log_set.start:,} bytes")
+
+    with col3:
+        st.metric("Last Rotation", log_set.last_rotation or "—")
+
+    with st.expander("📚 Segments"):
+        for segment in reversed(segments):
+            kind = "gzip" if segment.compressed else "plain"
+            st.text(f"{segment.path}  [{segment.start:,} – {segment.end:,})  {kind}")
+
+    tab_tail, tab_page, tab_search = st.tabs(["Tail", "Page", "Search"])
+
+    def _render(lines: List[Tuple[int, str, str]]):
+        rows = []
+        current = None
+        for offset, line, path in lines:
+            if path != current:
+                rows.append(f"──── {os.path.basename(path)} ────")
+                current = path
+            rows.append(f"{offset:>12,} | {line}")
+        st.code("\n".join(rows), language=None)
+
+    with tab_tail:
+        lines = log_set.tail_lines(max_lines)
+        if lines:
+            _render(lines)
+        else:
+            st.info("No content to display")
+
+    with tab_page:
+        start = st.number_input(
+            "Global offset",
+            min_value=log_set.start,
+            max_value=max(log_set.start, log_set.end),
+            value=log_set.start,
+            step=1024,
+            key=f"{component_key}_page_start"
+        )
+        page = log_set.page(int(start), max_lines)
+        if page:
+            _render(page)
+        else:
+            st.info("No content at this offset")
+
+    with tab_search:
+        pattern = st.text_input("Regex", key=f"{component_key}_search")
+        if pattern:
+            try:
+                hits = log_set.search(pattern, max_hits=max_lines, ignore_case=True)
+            except re.error as e:
+                st.error(f"Invalid pattern: {str(e)}")
+                hits = []
+            if hits:
+                _render(hits)
+            else:
+                st.info("No matches")
+
+    if auto_refresh:
+        st.info(f"🔄 Auto-refresh enabled (every {refresh_interval}s)")
+        time.sleep(refresh_interval)
+        st.rerun()
+
+    return [line for _, line, _ in lines]
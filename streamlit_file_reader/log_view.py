@@ -0,0 +1,216 @@
+import streamlit as st
+import streamlit.components.v1 as components
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .file_reader import _get_index_store
+from .state_manager import get_state_manager
+from .tail import read_head, read_tail_lines, same_head
+
+
+_FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend")
+_log_view = components.declare_component("log_view", path=_FRONTEND_DIR)
+
+
+def _read_appended_lines(file_path: str, offset: int, size: int) -> Tuple[List[Tuple[int, str]], int]:
+    """Complete lines in ``[offset, size)`` and the offset just past them"""
+    with open(file_path, 'rb') as file:
+        file.seek(offset)
+        data = file.read(size - offset)
+
+    end = data.rfind(b"\n") + 1
+    lines = []
+    position = offset
+    for raw in data[:end].split(b"\n")[:-1]:
+        lines.append((position, raw.rstrip(b"\r").decode('utf-8', errors='replace')))
+        position += len(raw) + 1
+    return lines, offset + end
+
+
+def _read_reset_lines(file_path: str, max_lines: int) -> Tuple[List[Tuple[int, str]], int]:
+    """Last complete lines of a file and the offset just past them"""
+    with open(file_path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size:
+            file.seek(size - 1)
+            ends_with_newline = file.read(1) == b"\n"
+        else:
+            ends_with_newline = True
+
+    # A trailing partial line is held back until its newline arrives
+    lines = read_tail_lines(file_path, max_lines + (0 if ends_with_newline else 1), end_offset=size)
+    if not ends_with_newline and lines:
+        return lines[:-1], lines[-1][0]
+    return lines, size
+
+
+def _read_update(
+    file_path: str,
+    state: Optional[Dict],
+    max_lines: int,
+    max_delta_bytes: int,
+    resync: Optional[int] = None
+) -> Tuple[bool, List[Tuple[int, str]], Dict]:
+    """
+    Lines to send to a view last left at ``state``.
+
+    Returns whether the view must be reset, the lines to send and the new
+    ``identity``/``offset``/``head`` of the view.
+    """
+    file_stat = os.stat(file_path)
+    identity = (file_stat.st_dev, file_stat.st_ino)
+    size = file_stat.st_size
+    head = read_head(file_path)
+
+    # A copytruncate may have grown the file past the old offset again, so
+    # a changed head counts as truncation too
+    reset = (
+        state is None
+        or state["identity"] != identity
+        or size < state["offset"]
+        or not same_head(state["head"], head)
+        or (resync is not None and resync != state["resync_handled"])
+    )
+
+    lines, offset = [], state["offset"] if state else 0
+    if not reset and size - state["offset"] > max_delta_bytes:
+        reset = True
+    if not reset and size > state["offset"]:
+        lines, offset = _read_appended_lines(file_path, state["offset"], size)
+        # Everything in the browser would be pushed out anyway
+        reset = len(lines) >= max_lines
+    if reset:
+        lines, offset = _read_reset_lines(file_path, max_lines)
+
+    return reset, lines, {"identity": identity, "offset": offset, "head": head}
+
+
+def log_view_component(
+    file_path: str,
+    max_lines: int = 1000,
+    auto_refresh: bool = False,
+    refresh_interval: float = 2.0,
+    show_line_numbers: bool = True,
+    height: int = 400,
+    persistent_index: bool = False,
+    max_delta_bytes: int = 4 * 1024 * 1024,
+    key: Optional[str] = None
+) -> Optional[List[str]]:
+    """
+    A log view that sends only appended lines to the browser.
+
+    The browser keeps a scrolling buffer of up to ``max_lines`` lines and
+    renders only the visible rows. Each update carries a sequence number;
+    the server sends the complete lines appended since the previous update,
+    and a full window only on the first render, after truncation or
+    replacement of the file, or when the browser reports it missed an
+    update. Payload and render cost therefore scale with what changed
+    rather than with ``max_lines``.
+
+    Parameters:
+    -----------
+    file_path : str
+        Path to the file to read
+    max_lines : int, default=1000
+        Maximum number of lines kept in the browser
+    auto_refresh : bool, default=False
+        Whether to automatically refresh
+    refresh_interval : float, default=2.0
+        Seconds between auto-refreshes (only when auto_refresh=True)
+    show_line_numbers : bool, default=True
+        Whether to show a gutter with line numbers (exact with
+        ``persistent_index``, byte offsets otherwise)
+    height : int, default=400
+        Height of the display area in pixels
+    persistent_index : bool, default=False
+        Use the on-disk index store for exact line numbers
+    max_delta_bytes : int, default=4194304
+        When more than this was appended since the last update, send a
+        fresh window from the end of the file instead of every line
+    key : str, optional
+        Widget key; defaults to one derived from ``file_path``
+
+    Returns:
+    --------
+    Optional[List[str]]
+        Lines sent to the browser in this update, or None if the file
+        can't be read
+    """
+
+    # Delta state belongs to one browser view, so it shares the widget's key
+    widget_key = key or f"log_view_{hash(file_path)}"
+    state_manager = get_state_manager()
+    state = state_manager.get(widget_key)
+
+    st.write(f"**File:** `{file_path}`")
+
+    try:
+        file_stat = os.stat(file_path)
+    except FileNotFoundError:
+        st.error(f"File not found: {file_path}")
+        return None
+    except OSError as e:
+        st.error(f"Error reading file: {str(e)}")
+        return None
+
+    size = file_stat.st_size
+
+    # The browser only reports back when it needs a full resync
+    ack = st.session_state.get(widget_key) or {}
+    resync = ack.get("resync")
+
+    try:
+        reset, lines, position = _read_update(file_path, state, max_lines, max_delta_bytes, resync)
+    except OSError as e:
+        st.error(f"Error reading file: {str(e)}")
+        return None
+
+    if state is None:
+        # A new epoch tells the browser its buffer belongs to an older view
+        state = {
+            "epoch": f"{time.time_ns():x}",
+            "seq": 0,
+            "resync_handled": None,
+        }
+
+    base_seq = state["seq"]
+    if reset or lines:
+        state["seq"] += 1
+    state.update(position)
+    state["resync_handled"] = resync
+    state_manager.put(widget_key, state)
+
+    start_line = None
+    if reset and persistent_index and lines:
+        start_line = _get_index_store().open(file_path).line_number(lines[0][0]) + 1
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.caption(f"{size:,} bytes · modified {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(file_stat.st_mtime))}")
+
+    with col2:
+        sent = "full window" if reset else "appended"
+        st.caption(f"Update #{state['seq']}: {len(lines):,} lines sent ({sent})")
+
+    _log_view(
+        epoch=state["epoch"],
+        seq=state["seq"],
+        base_seq=base_seq,
+        reset=reset,
+        lines=[[line_offset, line] for line_offset, line in lines],
+        start_line=start_line,
+        max_lines=max_lines,
+        show_line_numbers=show_line_numbers,
+        height=height,
+        key=widget_key,
+        default=None
+    )
+
+    if auto_refresh:
+        st.info(f"🔄 Auto-refresh enabled (every {refresh_interval}s)")
+        time.sleep(refresh_interval)
+        st.rerun()
+
+    return [line for _, line in lines]
@@ -0,0 +1,203 @@
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .throughput import RingBuffer
+
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _read_stat(pid: int) -> Optional[Tuple[int, int]]:
+    """``(ppid, CPU ticks)`` from /proc/<pid>/stat
+
+    The ticks include ``cutime + cstime``, the time of reaped children, so
+    children that start and exit between two samples are still counted.
+    """
+    try:
+        with open(f"/proc/{pid}/stat", 'rb') as file:
+            data = file.read()
+    except OSError:
+        return None
+    # The command name may contain spaces and parentheses; fields follow the last ")"
+    fields = data[data.rfind(b")") + 2:].split()
+    return int(fields[1]), sum(int(value) for value in fields[11:15])
+
+
+def _read_rss(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/statm", 'rb') as file:
+            return int(file.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+def _read_io(pid: int) -> Tuple[int, int]:
+    """``(rchar, wchar)``: bytes read and written through syscalls"""
+    counters = {}
+    try:
+        with open(f"/proc/{pid}/io", 'rb') as file:
+            for line in file:
+                name, _, value = line.partition(b":")
+                counters[name] = int(value)
+    except (OSError, ValueError):
+        pass
+    return counters.get(b"rchar", 0), counters.get(b"wchar", 0)
+
+
+def _children(pid: int) -> List[int]:
+    """Direct children of a process"""
+    try:
+        tids = os.listdir(f"/proc/{pid}/task")
+    except OSError:
+        return []
+
+    children = []
+    try:
+        for tid in tids:
+            with open(f"/proc/{pid}/task/{tid}/children", 'rb') as file:
+                children.extend(int(child) for child in file.read().split())
+        return children
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return children
+
+    # Kernels without CONFIG_PROC_CHILDREN: scan every process's parent
+    children = []
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            stat = _read_stat(int(entry))
+            if stat and stat[0] == pid:
+                children.append(int(entry))
+    return children
+
+
+class ResourceSampler:
+    """
+    Samples CPU, RSS and I/O of a process and its descendants.
+
+    A daemon thread reads ``/proc/<pid>/stat``, ``statm`` and ``io`` for
+    the process tree every ``interval`` seconds and stores the results in
+    fixed-size, array-backed ring buffers, so memory use is constant for
+    the life of the process. The sampler stops by itself when the process
+    exits. Only Linux (or another system with a Linux-style /proc) is
+    supported; elsewhere :attr:`available` is False.
+
+    Parameters:
+    -----------
+    pid : int
+        Process to sample
+    interval : float, default=1.0
+        Seconds between samples
+    capacity : int, default=300
+        Number of samples kept per series
+    """
+
+    def __init__(self, pid: int, interval: float = 1.0, capacity: int = 300):
+        self.pid = pid
+        self.interval = interval
+        self.available = os.path.exists(f"/proc/{pid}/stat")
+        self.timestamps = RingBuffer(capacity)
+        self.cpu_percent = RingBuffer(capacity)
+        self.rss_bytes = RingBuffer(capacity)
+        self.read_rate = RingBuffer(capacity)
+        self.write_rate = RingBuffer(capacity)
+        self.process_count = RingBuffer(capacity, 'l')
+        self.overhead_percent = 0.0
+        self._ticks: Dict[int, int] = {}
+        self._io: Dict[int, Tuple[int, int]] = {}
+        self._last_sample: Optional[float] = None
+        self._busy = 0.0
+        self._started: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start sampling in a background thread"""
+        if not self.available or self._thread is not None:
+            return
+        self._started = time.monotonic()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling; collected samples are kept"""
+        self._stop.set()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _tree(self) -> List[int]:
+        pids = [self.pid]
+        for pid in pids:
+            pids.extend(_children(pid))
+        return pids
+
+    def sample(self) -> bool:
+        """Take one sample; returns False once the process is gone"""
+        begin = time.thread_time()
+        now = time.monotonic()
+
+        ticks: Dict[int, int] = {}
+        io: Dict[int, Tuple[int, int]] = {}
+        rss = 0
+        for pid in self._tree():
+            stat = _read_stat(pid)
+            if stat is None:
+                continue
+            ticks[pid] = stat[1]
+            io[pid] = _read_io(pid)
+            rss += _read_rss(pid)
+
+        if self.pid not in ticks:
+            return False
+
+        if self._last_sample is not None:
+            elapsed = max(now - self._last_sample, 1e-6)
+            # Processes that exited since the last sample drop out of both sums;
+            # their parent's reaped-children time now includes what was
+            # already counted for them, so that part is taken off again
+            cpu_ticks = sum(max(0, value - self._ticks.get(pid, 0)) for pid, value in ticks.items())
+            cpu_ticks -= sum(value for pid, value in self._ticks.items() if pid not in ticks)
+            cpu_ticks = max(0, cpu_ticks)
+            read = sum(max(0, value[0] - self._io.get(pid, (0, 0))[0]) for pid, value in io.items())
+            written = sum(max(0, value[1] - self._io.get(pid, (0, 0))[1]) for pid, value in io.items())
+            self.timestamps.append(time.time())
+            self.cpu_percent.append(100.0 * cpu_ticks / _CLOCK_TICKS / elapsed)
+            self.rss_bytes.append(rss)
+            self.read_rate.append(read / elapsed)
+            self.write_rate.append(written / elapsed)
+            self.process_count.append(len(ticks))
+
+        self._ticks = ticks
+        self._io = io
+        self._last_sample = now
+
+        self._busy += time.thread_time() - begin
+        if self._started is not None:
+            self.overhead_percent = 100.0 * self._busy / max(now - self._started, 1e-6)
+        return True
+
+    def _run(self):
+        while not self._stop.is_set():
+            if not self.sample():
+                break
+            self._stop.wait(self.interval)
+
+    def series(self) -> Dict[str, List[float]]:
+        """All samples, oldest first, keyed by series name"""
+        series = {
+            "timestamp": self.timestamps.values(),
+            "cpu_percent": self.cpu_percent.values(),
+            "rss_mb": [value / (1024 * 1024) for value in self.rss_bytes.values()],
+            "read_kb_s": [value / 1024 for value in self.read_rate.values()],
+            "write_kb_s": [value / 1024 for value in self.write_rate.values()],
+            "processes": self.process_count.values(),
+        }
+        # The sampler thread may be mid-append; align series to equal length
+        length = min(len(values) for values in series.values())
+        return {name: values[len(values) - length:] for name, values in series.items()}
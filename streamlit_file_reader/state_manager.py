@@ -0,0 +1,139 @@
+import os
+import sys
+import threading
+from collections import OrderedDict, deque
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+try:
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+except ImportError:  # pragma: no cover - older Streamlit layouts
+    def get_script_run_ctx():
+        return None
+
+
+DEFAULT_BUDGET_BYTES = 256 * 1024 * 1024
+
+
+def _current_session_id() -> str:
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else "default"
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate bytes held by a reader's cached state"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(item) for item in value.values())
+    elif isinstance(value, (list, tuple, deque)):
+        size += sum(estimate_size(item) for item in value)
+    elif hasattr(value, "nbytes") and callable(value.nbytes):
+        size += value.nbytes()
+    return size
+
+
+class ReaderStateManager:
+    """
+    Server-wide store for the cached state of reader components.
+
+    Entries are keyed by ``(session_id, component_key)`` and accounted by
+    their approximate size. When the total exceeds ``budget_bytes`` the
+    least recently used entries, from any session, are evicted; a reader
+    whose entry was evicted simply reads its file again on the next run.
+
+    Parameters:
+    -----------
+    budget_bytes : int, default=268435456
+        Maximum bytes held by all reader instances together
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self._entries: "OrderedDict[Tuple[str, Hashable], Dict]" = OrderedDict()
+        self._sizes: Dict[Tuple[str, Hashable], int] = {}
+        self._total = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, component_key: Hashable, session_id: Optional[str] = None) -> Optional[Dict]:
+        """Cached state of a component in the current session, or None"""
+        key = (session_id or _current_session_id(), component_key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, component_key: Hashable, entry: Dict, session_id: Optional[str] = None):
+        """Store (or re-account after changes) a component's state"""
+        key = (session_id or _current_session_id(), component_key)
+        size = estimate_size(entry)
+        with self._lock:
+            self._total += size - self._sizes.get(key, 0)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._sizes[key] = size
+            self._evict(keep=key)
+
+    def discard(self, component_key: Hashable, session_id: Optional[str] = None):
+        """Drop a component's state"""
+        key = (session_id or _current_session_id(), component_key)
+        with self._lock:
+            self._remove(key)
+
+    def discard_session(self, session_id: str):
+        """Drop every entry of a session"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == session_id]:
+                self._remove(key)
+
+    def set_budget(self, budget_bytes: int):
+        """Change the budget, evicting immediately if it was lowered"""
+        with self._lock:
+            self.budget_bytes = budget_bytes
+            self._evict()
+
+    def usage(self) -> Dict[str, int]:
+        """Current accounting: bytes held, budget, entries, sessions, evictions"""
+        with self._lock:
+            return {
+                "total_bytes": self._total,
+                "budget_bytes": self.budget_bytes,
+                "entries": len(self._entries),
+                "sessions": len({key[0] for key in self._entries}),
+                "evictions": self._evictions,
+            }
+
+    def _remove(self, key: Tuple[str, Hashable]):
+        if key in self._entries:
+            del self._entries[key]
+            self._total -= self._sizes.pop(key)
+
+    def _evict(self, keep: Optional[Tuple[str, Hashable]] = None):
+        # Oldest first; the entry being stored is never evicted by its own put
+        # (put moves it to the end, so reaching it means nothing else is left)
+        while self._total > self.budget_bytes and self._entries:
+            key = next(iter(self._entries))
+            if key == keep:
+                break
+            self._remove(key)
+            self._evictions += 1
+
+
+_manager: Optional[ReaderStateManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_state_manager() -> ReaderStateManager:
+    """
+    The process-wide state manager.
+
+    The budget defaults to 256 MB and can be set with the
+    ``STREAMLIT_FILE_READER_STATE_BUDGET`` environment variable (in bytes)
+    or later with :meth:`ReaderStateManager.set_budget`.
+    """
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            budget = int(os.environ.get("STREAMLIT_FILE_READER_STATE_BUDGET", DEFAULT_BUDGET_BYTES))
+            _manager = ReaderStateManager(budget)
+        return _manager
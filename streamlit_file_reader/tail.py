@@ -0,0 +1,92 @@
+import os
+from typing import List, Optional, Tuple
+
+
+def read_tail_lines(
+    file_path: str,
+    max_lines: int,
+    max_bytes: Optional[int] = None,
+    end_offset: Optional[int] = None,
+    block_size: int = 64 * 1024
+) -> List[Tuple[int, str]]:
+    """
+    Read the last lines of a file by seeking backwards from the end.
+
+    Only the blocks needed to find ``max_lines`` lines are read, so the cost
+    depends on the size of the tail rather than the size of the file.
+
+    Parameters:
+    -----------
+    file_path : str
+        Path to the file to read
+    max_lines : int
+        Maximum number of lines to return
+    max_bytes : int, optional
+        Upper bound on the number of bytes read from the end of the file.
+        When the limit is hit the first (possibly partial) line is dropped.
+    end_offset : int, optional
+        Treat the file as ending at this byte offset (defaults to its size)
+    block_size : int, default=65536
+        Size of the blocks read while scanning backwards
+
+    Returns:
+    --------
+    List[Tuple[int, str]]
+        ``(byte_offset, line)`` pairs, oldest first, with newlines stripped
+    """
+    if max_lines <= 0:
+        return []
+
+    with open(file_path, 'rb') as file:
+        end = os.fstat(file.fileno()).st_size if end_offset is None else end_offset
+        limit = end if max_bytes is None else min(end, max_bytes)
+
+        data = b""
+        position = end
+        # One extra newline is needed to know where the oldest line starts
+        while position > end - limit and data.count(b"\n") <= max_lines:
+            step = min(block_size, position - (end - limit))
+            position -= step
+            file.seek(position)
+            data = file.read(step) + data
+
+    truncated = position > 0
+    raw_lines = data.split(b"\n")
+    offsets = []
+    offset = position
+    for raw in raw_lines:
+        offsets.append(offset)
+        offset += len(raw) + 1
+
+    # A trailing newline leaves an empty element that is not a line
+    if raw_lines and raw_lines[-1] == b"":
+        raw_lines.pop()
+        offsets.pop()
+
+    # The first element is a fragment unless the read reached the file start
+    if truncated and raw_lines:
+        raw_lines.pop(0)
+        offsets.pop(0)
+
+    raw_lines = raw_lines[-max_lines:]
+    offsets = offsets[-max_lines:]
+
+    return [
+        (line_offset, raw.rstrip(b"\r").decode('utf-8', errors='replace'))
+        for line_offset, raw in zip(offsets, raw_lines)
+    ]
+
+
+HEAD_BYTES = 4096
+
+
+def read_head(file_path: str, max_bytes: int = HEAD_BYTES) -> bytes:
+    """First bytes of a file, used to recognise it after a copytruncate"""
+    with open(file_path, 'rb') as file:
+        return file.read(max_bytes)
+
+
+def same_head(old: bytes, new: bytes) -> bool:
+    """Whether two heads of a file agree on the bytes both of them have"""
+    length = min(len(old), len(new))
+    return old[:length] == new[:length]
@@ -0,0 +1,255 @@
+import streamlit as st
+import os
+import re
+import time
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .tail import read_tail_lines
+
+
+# Leading "[2024-01-01 10:00:00]" / "2024-01-01T10:00:00.123Z" style stamps
+_TIMESTAMP_PREFIX = re.compile(
+    r"^\[?\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?\]?\s*"
+)
+_DIGIT_RUN = re.compile(r"\d+")
+
+
+class RingBuffer:
+    """Fixed-size, array-backed ring buffer of numeric samples"""
+
+    def __init__(self, capacity: int, typecode: str = 'd'):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._data = array(typecode, [0] * capacity)
+        self._capacity = capacity
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def append(self, value: float):
+        """Add a sample, overwriting the oldest one when full"""
+        self._data[self._next] = value
+        self._next = (self._next + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
+
+    def last(self) -> Optional[float]:
+        """Most recent sample, or None if empty"""
+        if not self._count:
+            return None
+        return self._data[self._next - 1]
+
+    def values(self) -> List[float]:
+        """Samples ordered from oldest to newest"""
+        if self._count < self._capacity:
+            return self._data[:self._count].tolist()
+        return (self._data[self._next:] + self._data[:self._next]).tolist()
+
+
+class ThroughputMeter:
+    """
+    Tracks lines/sec and bytes/sec of a growing file.
+
+    Byte rates come straight from the size delta. Line counts are measured
+    on at most ``window_bytes`` of each appended region and extrapolated, so
+    an update costs the same no matter how much was written since the last.
+    """
+
+    def __init__(self, history: int = 60, window_bytes: int = 1024 * 1024):
+        self.window_bytes = window_bytes
+        self.offset: Optional[int] = None
+        self.timestamp: Optional[float] = None
+        self.total_bytes = 0
+        self.total_lines = 0.0
+        self.estimated = False
+        self.bytes_per_sec = RingBuffer(history)
+        self.lines_per_sec = RingBuffer(history)
+
+    def update(self, file_path: str, now: Optional[float] = None) -> Tuple[int, int]:
+        """
+        Sample the file and record the rates since the previous sample.
+
+        Returns:
+        --------
+        Tuple[int, int]
+            ``(start, end)`` byte range appended since the previous sample
+        """
+        now = time.time() if now is None else now
+        size = os.path.getsize(file_path)
+
+        if self.offset is None or size < self.offset:
+            # First sample, or the file was truncated: restart from here
+            self.offset = size
+            self.timestamp = now
+            return size, size
+
+        start, end = self.offset, size
+        appended = end - start
+        window = min(appended, self.window_bytes)
+        lines = 0.0
+        if window:
+            with open(file_path, 'rb') as file:
+                file.seek(end - window)
+                newlines = file.read(window).count(b"\n")
+            lines = newlines * (appended / window)
+        self.estimated = appended > window
+
+        elapsed = max(now - self.timestamp, 1e-6)
+        self.bytes_per_sec.append(appended / elapsed)
+        self.lines_per_sec.append(lines / elapsed)
+        self.total_bytes += appended
+        self.total_lines += lines
+        self.offset = end
+        self.timestamp = now
+        return start, end
+
+
+def sample_lines(lines: List[str], max_lines: int) -> List[str]:
+    """Pick ``max_lines`` lines evenly spread over ``lines``, keeping order"""
+    if len(lines) <= max_lines:
+        return list(lines)
+    if max_lines <= 0:
+        return []
+    step = len(lines) / max_lines
+    return [lines[int(i * step)] for i in range(max_lines)]
+
+
+def dedupe_lines(lines: List[str], max_lines: int) -> List[Tuple[str, int]]:
+    """
+    Collapse repeated messages into ``(line, count)`` pairs.
+
+    Lines are grouped after stripping a leading timestamp and masking digit
+    runs, so "batch 17 done" and "batch 18 done" count as one message. The
+    most recent example of each message is kept, ordered by last occurrence.
+    """
+    groups: "OrderedDict[str, List]" = OrderedDict()
+    for line in lines:
+        key = _DIGIT_RUN.sub("#", _TIMESTAMP_PREFIX.sub("", line))
+        entry = groups.pop(key, None)
+        groups[key] = [line, entry[1] + 1 if entry else 1]
+    return [(line, count) for line, count in list(groups.values())[-max_lines:]]
+
+
+def _format_rate(value: float, unit: str) -> str:
+    for prefix in ("", "K", "M", "G"):
+        if abs(value) < 1000:
+            return f"{value:,.1f} {prefix}{unit}/s"
+        value /= 1000
+    return f"{value:,.1f} T{unit}/s"
+
+
+def high_rate_stream_component(
+    file_path: str,
+    max_lines: int = 50,
+    view: str = "sampled",
+    window_bytes: int = 1024 * 1024,
+    history: int = 60,
+    auto_refresh: bool = False,
+    refresh_interval: float = 2.0
+) -> Optional[List[str]]:
+    """
+    A file monitor for outputs that grow by thousands of lines per second.
+
+    Shows a throughput meter with a rolling sparkline and a bounded view of
+    the most recent ``window_bytes`` of the file. Work per refresh is fixed
+    by ``window_bytes`` regardless of how fast the file grows.
+
+    Parameters:
+    -----------
+    file_path : str
+        Path to the file to monitor
+    max_lines : int, default=50
+        Maximum number of lines to display
+    view : str, default="sampled"
+        "tail" for the last lines, "sampled" for lines evenly spread over the
+        window, or "deduplicated" for repeated messages collapsed to "×N"
+    window_bytes : int, default=1048576
+        Bytes read from the end of the file on each refresh
+    history : int, default=60
+        Number of throughput samples kept for the sparkline
+    auto_refresh : bool, default=False
+        Whether to automatically refresh
+    refresh_interval : float, default=2.0
+        Seconds between auto-refreshes (only when auto_refresh=True)
+
+    Returns:
+    --------
+    Optional[List[str]]
+        Lines displayed, or None if the file can't be read
+    """
+
+    component_key = f"high_rate_{hash(file_path)}"
+
+    if f"{component_key}_meter" not in st.session_state:
+        st.session_state[f"{component_key}_meter"] = ThroughputMeter(history, window_bytes)
+
+    meter = st.session_state[f"{component_key}_meter"]
+
+    st.write(f"**File:** `{file_path}`")
+
+    if not Path(file_path).is_file():
+        st.error(f"File not found: {file_path}")
+        return None
+
+    try:
+        meter.update(file_path)
+        window = [line for _, line in read_tail_lines(
+            file_path,
+            max_lines=max(max_lines, window_bytes // 16),
+            max_bytes=window_bytes
+        )]
+    except OSError as e:
+        st.error(f"Error reading file: {str(e)}")
+        return None
+
+    # Throughput metrics
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        lines_rate = meter.lines_per_sec.last() or 0.0
+        prefix = "~" if meter.estimated else ""
+        st.metric("Lines/sec", prefix + _format_rate(lines_rate, "lines"))
+
+    with col2:
+        st.metric("Bytes/sec", _format_rate(meter.bytes_per_sec.last() or 0.0, "B"))
+
+    with col3:
+        st.metric("Total Since Start", f"{meter.total_bytes:,} bytes")
+
+    if len(meter.lines_per_sec) > 1:
+        st.line_chart({"lines/sec": meter.lines_per_sec.values()}, height=120)
+
+    # Bounded view over the window
+    if view == "deduplicated":
+        rows = [
+            f"×{count:<6d} {line}" if count > 1 else f"{'':8s}{line}"
+            for line, count in dedupe_lines(window, max_lines)
+        ]
+        caption = f"{len(rows)} distinct messages in the last {window_bytes:,} bytes"
+    elif view == "sampled":
+        rows = sample_lines(window, max_lines)
+        caption = f"{len(rows)} of {len(window):,} lines sampled from the last {window_bytes:,} bytes"
+    else:
+        rows = window[-max_lines:]
+        caption = f"last {len(rows)} lines"
+
+    if rows:
+        st.write(f"**Content** ({caption}):")
+        st.code("\n".join(rows), language=None)
+    else:
+        st.info("No content to display")
+
+    if auto_refresh:
+        st.info(f"🔄 Auto-refresh enabled (every {refresh_interval}s)")
+        time.sleep(refresh_interval)
+        st.rerun()
+
+    return rows
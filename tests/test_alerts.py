@@ -0,0 +1,58 @@
+import pytest
+
+pytest.importorskip("streamlit")
+
+from streamlit_file_reader.alerts import AlertMatcher, WatchRule
+
+
+def _write(path, data, mode="ab"):
+    with open(path, mode) as file:
+        file.write(data)
+
+
+def test_every_matching_rule_is_reported():
+    matcher = AlertMatcher([
+        WatchRule("error", "ERROR", ignore_case=True),
+        WatchRule("oom", "OutOfMemoryError"),
+        WatchRule("dead", "dead"),
+        WatchRule("deadlock", "deadlock"),
+        WatchRule("repeat", r"(x)\1"),
+    ])
+    found = matcher.feed("app.log", b"java.lang.OutOfMemoryError: heap\ndeadlock here\nxx\n", 0)
+    assert found == 5
+    assert matcher.counts == {"error": 1, "oom": 1, "dead": 1, "deadlock": 1, "repeat": 1}
+
+
+def test_unicode_patterns_and_offsets():
+    matcher = AlertMatcher([WatchRule("cafe", "café", ignore_case=True), WatchRule("e", r"ét")])
+    data = "naïve\nCAFÉ ouvert\nété\n".encode()
+    assert matcher.feed("app.log", data, 100) == 2
+    hits = [(name, offset, line) for name, _, offset, line in matcher.hits]
+    assert hits == [("cafe", 107, "CAFÉ ouvert"), ("e", 107 + len("CAFÉ ouvert\n".encode()), "été")]
+
+
+def test_poll_restarts_after_copytruncate_that_regrew(tmp_path):
+    path = tmp_path / "app.log"
+    _write(path, b"start\n")
+    matcher = AlertMatcher([WatchRule("error", "ERROR")])
+    matcher.poll(str(path))
+
+    _write(path, b"ERROR one\n")
+    assert matcher.poll(str(path)) == 1
+
+    # Truncated and written past the old position before the next poll
+    _write(path, b"ERROR two\nnothing to see here\n", mode="wb")
+    assert matcher.poll(str(path)) == 1
+    assert matcher.hits[-1][2:] == (0, "ERROR two")
+
+
+def test_poll_waits_for_complete_lines(tmp_path):
+    path = tmp_path / "app.log"
+    _write(path, b"")
+    matcher = AlertMatcher([WatchRule("error", "ERROR")])
+    matcher.poll(str(path))
+
+    _write(path, b"ERR")
+    assert matcher.poll(str(path)) == 0
+    _write(path, b"OR split\n")
+    assert matcher.poll(str(path)) == 1
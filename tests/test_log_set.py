@@ -0,0 +1,81 @@
+import gzip
+import os
+import shutil
+
+import pytest
+
+pytest.importorskip("streamlit")
+
+from streamlit_file_reader.log_set import LogSet
+
+
+def _write(path, data, mode="ab"):
+    with open(path, mode) as file:
+        file.write(data)
+
+
+def _offsets(log_set):
+    return {line: offset for offset, line, _ in log_set.iter_lines()}
+
+
+def test_copytruncate_after_growth_keeps_offsets(tmp_path):
+    base = str(tmp_path / "app.log")
+    _write(base, b"first\n")
+    log_set = LogSet(base)
+    log_set.refresh()
+
+    # Grows, rotates and grows past its last-seen size before the next refresh
+    _write(base, b"second\n")
+    shutil.copy(base, base + ".1")
+    _write(base, b"", mode="wb")
+    _write(base, b"third!!!\n")
+    log_set.refresh()
+
+    assert log_set.last_rotation == "copytruncate"
+    assert log_set.start == 0
+    assert _offsets(log_set) == {"first": 0, "second": 6, "third!!!": 13}
+
+
+def test_rename_rotation_keeps_offsets(tmp_path):
+    base = str(tmp_path / "app.log")
+    _write(base, b"first\n")
+    log_set = LogSet(base)
+    log_set.refresh()
+
+    os.rename(base, base + ".1")
+    _write(base, b"second\n")
+    log_set.refresh()
+
+    assert log_set.last_rotation == "rename"
+    assert _offsets(log_set) == {"first": 0, "second": 6}
+
+
+def test_compressing_an_archive_is_not_a_rotation(tmp_path):
+    base = str(tmp_path / "app.log")
+    _write(base, b"first\n")
+    os.rename(base, base + ".1")
+    _write(base, b"second\n")
+    log_set = LogSet(base)
+    log_set.refresh()
+
+    with open(base + ".1", "rb") as source, gzip.open(base + ".1.gz", "wb") as target:
+        target.write(source.read())
+    os.remove(base + ".1")
+    _write(base, b"third\n")
+    log_set.refresh()
+
+    assert log_set.last_rotation is None
+    assert _offsets(log_set) == {"first": 0, "second": 6, "third": 13}
+
+
+def test_tail_reads_past_the_cached_archive_tail(tmp_path):
+    base = str(tmp_path / "app.log")
+    with gzip.open(base + ".1.gz", "wb") as file:
+        file.write(b"".join(b"mid%03d\n" % i for i in range(100)))
+    _write(base, b"live0\nlive1\n")
+    log_set = LogSet(base, tail_bytes=50)
+    log_set.refresh()
+
+    lines = [line for _, line, _ in log_set.tail_lines(12)]
+    assert lines == ["mid%03d" % i for i in range(90, 100)] + ["live0", "live1"]
+    assert [offset for offset, _, _ in log_set.tail_lines(3)][0] == 99 * 7
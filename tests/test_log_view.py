@@ -0,0 +1,40 @@
+import pytest
+
+pytest.importorskip("streamlit")
+
+from streamlit_file_reader.log_view import _read_update
+
+
+def _write(path, data, mode="ab"):
+    with open(path, mode) as file:
+        file.write(data)
+
+
+def _update(path, state):
+    reset, lines, position = _read_update(str(path), state, max_lines=100, max_delta_bytes=1024)
+    return reset, lines, dict(state or {}, resync_handled=None, **position)
+
+
+def test_appended_lines_are_sent_as_delta(tmp_path):
+    path = tmp_path / "app.log"
+    _write(path, b"a\nb\n")
+    reset, lines, state = _update(path, None)
+    assert reset and lines == [(0, "a"), (2, "b")]
+
+    _write(path, b"c\nd")
+    reset, lines, state = _update(path, state)
+    assert not reset and lines == [(4, "c")]
+
+
+def test_copytruncate_after_growth_resets_view(tmp_path):
+    path = tmp_path / "app.log"
+    _write(path, b"a\nb\n")
+    _, _, state = _update(path, None)
+    _write(path, b"c\nd")
+    _, _, state = _update(path, state)
+
+    # Truncated and grown past the old offset before the next update
+    _write(path, b"NEWLINE-one-long\nNEWLINE-two\n", mode="wb")
+    reset, lines, state = _update(path, state)
+    assert reset
+    assert lines == [(0, "NEWLINE-one-long"), (17, "NEWLINE-two")]